@@ -0,0 +1,74 @@
+"""Compute documents.quality_score as a stored generated column
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-15 00:00:00
+
+Applies on top of the schema created by scripts/init-db.sql.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: str | None = None
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+QUALITY_SCORE_SQL = (
+    "ROUND(("
+    "CASE WHEN has_abstract THEN 0.3 ELSE 0 END"
+    " + CASE WHEN has_full_text THEN 0.3 ELSE 0 END"
+    " + LEAST(COALESCE(section_count, 0) / 5.0, 1.0) * 0.2"
+    " + LEAST(COALESCE(reference_count, 0) / 20.0, 1.0) * 0.2"
+    ")::numeric, 2)::double precision"
+)
+
+DOCUMENT_STATS_VIEW = """
+    CREATE OR REPLACE VIEW document_stats AS
+    SELECT
+        processing_status,
+        COUNT(*) as count,
+        AVG(quality_score) as avg_quality_score,
+        AVG(section_count) as avg_section_count,
+        AVG(word_count) as avg_word_count
+    FROM documents
+    GROUP BY processing_status
+"""
+
+
+def upgrade() -> None:
+    # A plain column cannot be converted in place; document_stats depends on it
+    op.execute("DROP VIEW IF EXISTS document_stats")
+    op.drop_column("documents", "quality_score")
+    op.add_column(
+        "documents",
+        sa.Column(
+            "quality_score",
+            sa.Float(),
+            sa.Computed(QUALITY_SCORE_SQL, persisted=True),
+            nullable=False,
+        ),
+    )
+    op.create_check_constraint(
+        "documents_quality_score_check",
+        "documents",
+        "quality_score >= 0 AND quality_score <= 1",
+    )
+    op.execute(DOCUMENT_STATS_VIEW)
+
+
+def downgrade() -> None:
+    op.execute("DROP VIEW IF EXISTS document_stats")
+    op.drop_column("documents", "quality_score")
+    op.add_column("documents", sa.Column("quality_score", sa.Float(), nullable=True))
+    op.execute(f"UPDATE documents SET quality_score = {QUALITY_SCORE_SQL}")
+    op.create_check_constraint(
+        "documents_quality_score_check",
+        "documents",
+        "quality_score >= 0 AND quality_score <= 1",
+    )
+    op.execute(DOCUMENT_STATS_VIEW)
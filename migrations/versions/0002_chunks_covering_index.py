@@ -0,0 +1,33 @@
+"""Covering index on chunks(document_id, chunk_index)
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15 00:00:00
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: str | None = "0001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_chunks_chunk_index")
+    op.execute("DROP INDEX IF EXISTS idx_chunks_document_chunk")
+    op.create_index(
+        "idx_chunks_document_chunk",
+        "chunks",
+        ["document_id", "chunk_index"],
+        postgresql_include=["section_title", "embedding_model_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_chunks_document_chunk", table_name="chunks")
+    op.create_index("idx_chunks_chunk_index", "chunks", ["document_id", "chunk_index"])
@@ -0,0 +1,51 @@
+"""Store documents.mesh_terms and keywords as text[]
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15 00:00:00
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: str | None = "0002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+COLUMNS = ("mesh_terms", "keywords")
+
+
+def upgrade() -> None:
+    # ALTER ... USING does not accept subqueries, so unpack through a helper
+    op.execute(
+        """
+        CREATE FUNCTION pg_temp.jsonb_to_text_array(value jsonb) RETURNS text[]
+        LANGUAGE sql IMMUTABLE AS $$
+            SELECT COALESCE(ARRAY(SELECT jsonb_array_elements_text(value)), '{}')
+        $$
+        """
+    )
+    for column in COLUMNS:
+        op.execute(f"ALTER TABLE documents ALTER COLUMN {column} DROP DEFAULT")
+        op.execute(
+            f"ALTER TABLE documents ALTER COLUMN {column} TYPE text[] "
+            f"USING pg_temp.jsonb_to_text_array({column})"
+        )
+        op.execute(f"ALTER TABLE documents ALTER COLUMN {column} SET DEFAULT '{{}}'")
+    op.execute("DROP FUNCTION pg_temp.jsonb_to_text_array(jsonb)")
+
+    op.create_index("idx_documents_mesh_terms", "documents", ["mesh_terms"], postgresql_using="gin")
+
+
+def downgrade() -> None:
+    op.drop_index("idx_documents_mesh_terms", table_name="documents")
+    for column in COLUMNS:
+        op.execute(f"ALTER TABLE documents ALTER COLUMN {column} DROP DEFAULT")
+        op.execute(
+            f"ALTER TABLE documents ALTER COLUMN {column} TYPE jsonb USING to_jsonb({column})"
+        )
+        op.execute(f"ALTER TABLE documents ALTER COLUMN {column} SET DEFAULT '[]'::jsonb")
@@ -0,0 +1,161 @@
+"""Store embeddings as halfvec(1536)
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-15 00:00:00
+
+Requires pgvector 0.7+ on the server.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: str | None = "0003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+HYBRID_SEARCH_FUNCTION = """
+    CREATE OR REPLACE FUNCTION hybrid_search(
+        query_embedding {vector_type},
+        query_text TEXT,
+        match_count INTEGER DEFAULT 10,
+        vector_weight FLOAT DEFAULT 0.7,
+        keyword_weight FLOAT DEFAULT 0.3,
+        filter_journals TEXT[] DEFAULT NULL,
+        filter_date_from DATE DEFAULT NULL,
+        filter_date_to DATE DEFAULT NULL
+    )
+    RETURNS TABLE (
+        chunk_id UUID,
+        document_id UUID,
+        content TEXT,
+        section_title VARCHAR(500),
+        vector_rank INTEGER,
+        keyword_rank INTEGER,
+        rrf_score FLOAT,
+        vector_similarity FLOAT
+    ) AS $$
+    BEGIN
+        RETURN QUERY
+        WITH vector_results AS (
+            SELECT
+                c.id,
+                c.document_id,
+                c.content,
+                c.section_title,
+                1 - (c.embedding <=> query_embedding) as similarity,
+                ROW_NUMBER() OVER (ORDER BY c.embedding <=> query_embedding) as rank
+            FROM chunks c
+            JOIN documents d ON c.document_id = d.id
+            WHERE c.embedding IS NOT NULL
+                AND d.processing_status = 'completed'
+                AND (filter_journals IS NULL OR d.journal = ANY(filter_journals))
+                AND (filter_date_from IS NULL OR d.publication_date >= filter_date_from)
+                AND (filter_date_to IS NULL OR d.publication_date <= filter_date_to)
+            ORDER BY c.embedding <=> query_embedding
+            LIMIT match_count * 2
+        ),
+        keyword_results AS (
+            SELECT
+                c.id,
+                c.document_id,
+                c.content,
+                c.section_title,
+                ts_rank(to_tsvector('biomedical', c.content), plainto_tsquery('biomedical', query_text)) as rank_score,
+                ROW_NUMBER() OVER (ORDER BY ts_rank(to_tsvector('biomedical', c.content), plainto_tsquery('biomedical', query_text)) DESC) as rank
+            FROM chunks c
+            JOIN documents d ON c.document_id = d.id
+            WHERE to_tsvector('biomedical', c.content) @@ plainto_tsquery('biomedical', query_text)
+                AND d.processing_status = 'completed'
+                AND (filter_journals IS NULL OR d.journal = ANY(filter_journals))
+                AND (filter_date_from IS NULL OR d.publication_date >= filter_date_from)
+                AND (filter_date_to IS NULL OR d.publication_date <= filter_date_to)
+            ORDER BY rank_score DESC
+            LIMIT match_count * 2
+        ),
+        combined AS (
+            SELECT
+                COALESCE(v.id, k.id) as chunk_id,
+                COALESCE(v.document_id, k.document_id) as document_id,
+                COALESCE(v.content, k.content) as content,
+                COALESCE(v.section_title, k.section_title) as section_title,
+                COALESCE(v.rank, 1000)::INTEGER as vector_rank,
+                COALESCE(k.rank, 1000)::INTEGER as keyword_rank,
+                v.similarity as vector_similarity,
+                -- RRF formula: 1/(k + rank) where k=60 is standard
+                (vector_weight * (1.0 / (60 + COALESCE(v.rank, 1000))) +
+                 keyword_weight * (1.0 / (60 + COALESCE(k.rank, 1000)))) as rrf_score
+            FROM vector_results v
+            FULL OUTER JOIN keyword_results k ON v.id = k.id
+        )
+        SELECT
+            combined.chunk_id,
+            combined.document_id,
+            combined.content,
+            combined.section_title,
+            combined.vector_rank,
+            combined.keyword_rank,
+            combined.rrf_score,
+            combined.vector_similarity
+        FROM combined
+        ORDER BY combined.rrf_score DESC
+        LIMIT match_count;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+CHUNK_STATS_VIEW = """
+    CREATE OR REPLACE VIEW chunk_stats AS
+    SELECT
+        d.processing_status,
+        COUNT(c.id) as total_chunks,
+        AVG(c.token_count) as avg_token_count,
+        COUNT(CASE WHEN c.embedding IS NOT NULL THEN 1 END) as chunks_with_embeddings
+    FROM documents d
+    LEFT JOIN chunks c ON d.id = c.document_id
+    GROUP BY d.processing_status
+"""
+
+HYBRID_SEARCH_ARGS = "{vector_type}, TEXT, INTEGER, FLOAT, FLOAT, TEXT[], DATE, DATE"
+
+
+def _convert(vector_type: str, opclass: str) -> None:
+    # chunk_stats reads chunks.embedding, which blocks the column type change
+    op.execute("DROP VIEW IF EXISTS chunk_stats")
+    op.execute("DROP INDEX IF EXISTS idx_chunks_embedding_hnsw")
+    op.execute(
+        f"ALTER TABLE chunks ALTER COLUMN embedding TYPE {vector_type} "
+        f"USING embedding::{vector_type}"
+    )
+    op.execute(
+        f"ALTER TABLE search_history ALTER COLUMN query_embedding TYPE {vector_type} "
+        f"USING query_embedding::{vector_type}"
+    )
+    op.execute(
+        f"CREATE INDEX idx_chunks_embedding_hnsw ON chunks "
+        f"USING hnsw (embedding {opclass}) WITH (m = 16, ef_construction = 64)"
+    )
+    op.execute(CHUNK_STATS_VIEW)
+    op.execute(HYBRID_SEARCH_FUNCTION.format(vector_type=vector_type))
+
+
+def upgrade() -> None:
+    # The argument type is part of the function signature, so drop the old overload
+    op.execute(
+        "DROP FUNCTION IF EXISTS hybrid_search("
+        + HYBRID_SEARCH_ARGS.format(vector_type="vector(1536)")
+        + ")"
+    )
+    _convert("halfvec(1536)", "halfvec_cosine_ops")
+
+
+def downgrade() -> None:
+    op.execute(
+        "DROP FUNCTION IF EXISTS hybrid_search("
+        + HYBRID_SEARCH_ARGS.format(vector_type="halfvec(1536)")
+        + ")"
+    )
+    _convert("vector(1536)", "vector_cosine_ops")
@@ -0,0 +1,32 @@
+"""Store chunks.content_hash as a raw SHA-256 digest
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-15 00:00:00
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: str | None = "0005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # The type change rewrites the table and rebuilds idx_chunks_content_hash
+    op.execute(
+        "ALTER TABLE chunks ALTER COLUMN content_hash TYPE bytea "
+        "USING decode(content_hash, 'hex')"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE chunks ALTER COLUMN content_hash TYPE varchar(64) "
+        "USING encode(content_hash, 'hex')"
+    )
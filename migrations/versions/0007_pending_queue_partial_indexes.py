@@ -0,0 +1,44 @@
+"""Replace status indexes with partial indexes on the pending queue
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-15 00:00:00
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: str | None = "0006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.drop_index("idx_documents_processing_status", table_name="documents", if_exists=True)
+    op.drop_index("idx_processing_jobs_status", table_name="processing_jobs", if_exists=True)
+
+    op.create_index(
+        "idx_documents_pending",
+        "documents",
+        ["created_at"],
+        postgresql_where=sa.text("processing_status IN ('pending', 'retrying')"),
+    )
+    op.create_index(
+        "idx_jobs_pending",
+        "processing_jobs",
+        [sa.text("priority DESC"), "created_at"],
+        postgresql_where=sa.text("status IN ('pending', 'retrying')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_jobs_pending", table_name="processing_jobs")
+    op.drop_index("idx_documents_pending", table_name="documents")
+
+    op.create_index("idx_processing_jobs_status", "processing_jobs", ["status"])
+    op.create_index("idx_documents_processing_status", "documents", ["processing_status"])
@@ -0,0 +1,133 @@
+"""Store the chunk full-text search vector as a generated column
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-15 00:00:00
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0008"
+down_revision: str | None = "0007"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+CONTENT_TSVECTOR_SQL = "to_tsvector('biomedical'::regconfig, content)"
+
+HYBRID_SEARCH_FUNCTION = """
+    CREATE OR REPLACE FUNCTION hybrid_search(
+        query_embedding halfvec(1536),
+        query_text TEXT,
+        match_count INTEGER DEFAULT 10,
+        vector_weight FLOAT DEFAULT 0.7,
+        keyword_weight FLOAT DEFAULT 0.3,
+        filter_journals TEXT[] DEFAULT NULL,
+        filter_date_from DATE DEFAULT NULL,
+        filter_date_to DATE DEFAULT NULL
+    )
+    RETURNS TABLE (
+        chunk_id UUID,
+        document_id UUID,
+        content TEXT,
+        section_title VARCHAR(500),
+        vector_rank INTEGER,
+        keyword_rank INTEGER,
+        rrf_score FLOAT,
+        vector_similarity FLOAT
+    ) AS $$
+    BEGIN
+        RETURN QUERY
+        WITH vector_results AS (
+            SELECT
+                c.id,
+                c.document_id,
+                c.content,
+                c.section_title,
+                1 - (c.embedding <=> query_embedding) as similarity,
+                ROW_NUMBER() OVER (ORDER BY c.embedding <=> query_embedding) as rank
+            FROM chunks c
+            JOIN documents d ON c.document_id = d.id
+            WHERE c.embedding IS NOT NULL
+                AND d.processing_status = 'completed'
+                AND (filter_journals IS NULL OR d.journal = ANY(filter_journals))
+                AND (filter_date_from IS NULL OR d.publication_date >= filter_date_from)
+                AND (filter_date_to IS NULL OR d.publication_date <= filter_date_to)
+            ORDER BY c.embedding <=> query_embedding
+            LIMIT match_count * 2
+        ),
+        keyword_results AS (
+            SELECT
+                c.id,
+                c.document_id,
+                c.content,
+                c.section_title,
+                ts_rank({content_tsvector}, plainto_tsquery('biomedical', query_text)) as rank_score,
+                ROW_NUMBER() OVER (ORDER BY ts_rank({content_tsvector}, plainto_tsquery('biomedical', query_text)) DESC) as rank
+            FROM chunks c
+            JOIN documents d ON c.document_id = d.id
+            WHERE {content_tsvector} @@ plainto_tsquery('biomedical', query_text)
+                AND d.processing_status = 'completed'
+                AND (filter_journals IS NULL OR d.journal = ANY(filter_journals))
+                AND (filter_date_from IS NULL OR d.publication_date >= filter_date_from)
+                AND (filter_date_to IS NULL OR d.publication_date <= filter_date_to)
+            ORDER BY rank_score DESC
+            LIMIT match_count * 2
+        ),
+        combined AS (
+            SELECT
+                COALESCE(v.id, k.id) as chunk_id,
+                COALESCE(v.document_id, k.document_id) as document_id,
+                COALESCE(v.content, k.content) as content,
+                COALESCE(v.section_title, k.section_title) as section_title,
+                COALESCE(v.rank, 1000)::INTEGER as vector_rank,
+                COALESCE(k.rank, 1000)::INTEGER as keyword_rank,
+                v.similarity as vector_similarity,
+                -- RRF formula: 1/(k + rank) where k=60 is standard
+                (vector_weight * (1.0 / (60 + COALESCE(v.rank, 1000))) +
+                 keyword_weight * (1.0 / (60 + COALESCE(k.rank, 1000)))) as rrf_score
+            FROM vector_results v
+            FULL OUTER JOIN keyword_results k ON v.id = k.id
+        )
+        SELECT
+            combined.chunk_id,
+            combined.document_id,
+            combined.content,
+            combined.section_title,
+            combined.vector_rank,
+            combined.keyword_rank,
+            combined.rrf_score,
+            combined.vector_similarity
+        FROM combined
+        ORDER BY combined.rrf_score DESC
+        LIMIT match_count;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+
+def upgrade() -> None:
+    # Rewrites chunks once so keyword search no longer re-tokenizes every
+    # matching row to rank it
+    op.execute(
+        "ALTER TABLE chunks ADD COLUMN content_tsv tsvector "
+        f"GENERATED ALWAYS AS ({CONTENT_TSVECTOR_SQL}) STORED"
+    )
+    op.create_index("idx_chunks_content_tsv", "chunks", ["content_tsv"], postgresql_using="gin")
+    op.drop_index("idx_chunks_content_fts", table_name="chunks", if_exists=True)
+    op.execute(HYBRID_SEARCH_FUNCTION.format(content_tsvector="c.content_tsv"))
+
+
+def downgrade() -> None:
+    op.execute(
+        HYBRID_SEARCH_FUNCTION.format(content_tsvector="to_tsvector('biomedical', c.content)")
+    )
+    op.execute(
+        "CREATE INDEX idx_chunks_content_fts "
+        "ON chunks USING gin(to_tsvector('biomedical', content))"
+    )
+    op.drop_index("idx_chunks_content_tsv", table_name="chunks")
+    op.drop_column("chunks", "content_tsv")
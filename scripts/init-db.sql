@@ -6,7 +6,6 @@
 -- Enable required extensions
 CREATE EXTENSION IF NOT EXISTS vector;
 CREATE EXTENSION IF NOT EXISTS pg_trgm;
-CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 
 -- =============================================================================
 -- Custom Text Search Configuration for Biomedical Terms
@@ -21,7 +20,7 @@ CREATE TEXT SEARCH CONFIGURATION biomedical (COPY = english);
 -- Documents Table
 -- =============================================================================
 CREATE TABLE IF NOT EXISTS documents (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
 
     -- Core metadata
     title TEXT NOT NULL,
@@ -36,8 +35,8 @@ CREATE TABLE IF NOT EXISTS documents (
     pmid VARCHAR(50),
 
     -- Classification
-    mesh_terms JSONB DEFAULT '[]'::jsonb,
-    keywords JSONB DEFAULT '[]'::jsonb,
+    mesh_terms TEXT[] DEFAULT '{}',
+    keywords TEXT[] DEFAULT '{}',
     article_type VARCHAR(100),
 
     -- Source and storage
@@ -52,12 +51,20 @@ CREATE TABLE IF NOT EXISTS documents (
     processing_attempts INTEGER DEFAULT 0,
 
     -- Quality metrics
-    quality_score FLOAT CHECK (quality_score >= 0 AND quality_score <= 1),
     has_abstract BOOLEAN DEFAULT FALSE,
     has_full_text BOOLEAN DEFAULT FALSE,
     section_count INTEGER DEFAULT 0,
     reference_count INTEGER DEFAULT 0,
     word_count INTEGER DEFAULT 0,
+    -- Completeness score, kept in sync by Postgres (same formula as calculate_quality_score)
+    quality_score FLOAT NOT NULL GENERATED ALWAYS AS (
+        ROUND((
+            CASE WHEN has_abstract THEN 0.3 ELSE 0 END
+            + CASE WHEN has_full_text THEN 0.3 ELSE 0 END
+            + LEAST(COALESCE(section_count, 0) / 5.0, 1.0) * 0.2
+            + LEAST(COALESCE(reference_count, 0) / 20.0, 1.0) * 0.2
+        )::numeric, 2)::double precision
+    ) STORED CHECK (quality_score >= 0 AND quality_score <= 1),
 
     -- Flags
     retracted BOOLEAN DEFAULT FALSE,
@@ -77,12 +84,13 @@ CREATE TABLE IF NOT EXISTS documents (
 -- Chunks Table
 -- =============================================================================
 CREATE TABLE IF NOT EXISTS chunks (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     document_id UUID NOT NULL REFERENCES documents(id) ON DELETE CASCADE,
 
     -- Content
     content TEXT NOT NULL,
-    content_hash VARCHAR(64), -- SHA-256 for deduplication
+    content_hash BYTEA, -- raw SHA-256 digest (32 bytes) for deduplication
+    content_tsv tsvector GENERATED ALWAYS AS (to_tsvector('biomedical'::regconfig, content)) STORED,
 
     -- Position and structure
     section_title VARCHAR(500),
@@ -94,7 +102,7 @@ CREATE TABLE IF NOT EXISTS chunks (
     token_count INTEGER,
 
     -- Embedding with versioning (1536 dimensions for Bedrock Titan)
-    embedding vector(1536),
+    embedding halfvec(1536), -- FP16; embeddings are generated as FP32 and cast on write
     embedding_model_id VARCHAR(100), -- e.g., 'amazon.titan-embed-text-v1'
     embedding_version INTEGER DEFAULT 1,
     embedding_created_at TIMESTAMP WITH TIME ZONE,
@@ -115,7 +123,7 @@ CREATE TABLE IF NOT EXISTS chunks (
 -- Processing Jobs Table (for tracking async ingestion)
 -- =============================================================================
 CREATE TABLE IF NOT EXISTS processing_jobs (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     document_id UUID REFERENCES documents(id) ON DELETE CASCADE,
 
     -- Job details
@@ -152,11 +160,11 @@ CREATE TABLE IF NOT EXISTS processing_jobs (
 -- Search History Table (for analytics)
 -- =============================================================================
 CREATE TABLE IF NOT EXISTS search_history (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
 
     -- Query details
     query_text TEXT NOT NULL,
-    query_embedding vector(1536),
+    query_embedding halfvec(1536),
     search_type VARCHAR(20) NOT NULL, -- 'vector', 'keyword', 'hybrid'
 
     -- Filters applied
@@ -185,9 +193,12 @@ CREATE TABLE IF NOT EXISTS search_history (
 CREATE INDEX IF NOT EXISTS idx_documents_doi ON documents(doi);
 CREATE INDEX IF NOT EXISTS idx_documents_pmcid ON documents(pmcid);
 CREATE INDEX IF NOT EXISTS idx_documents_publication_date ON documents(publication_date);
-CREATE INDEX IF NOT EXISTS idx_documents_processing_status ON documents(processing_status);
+-- Partial index for the pending queue; most documents are completed
+CREATE INDEX IF NOT EXISTS idx_documents_pending ON documents(created_at)
+    WHERE processing_status IN ('pending', 'retrying');
 CREATE INDEX IF NOT EXISTS idx_documents_journal ON documents(journal);
 CREATE INDEX IF NOT EXISTS idx_documents_created_at ON documents(created_at);
+CREATE INDEX IF NOT EXISTS idx_documents_mesh_terms ON documents USING gin(mesh_terms);
 
 -- Full-text search indexes for documents
 CREATE INDEX IF NOT EXISTS idx_documents_title_fts
@@ -201,22 +212,26 @@ CREATE INDEX IF NOT EXISTS idx_documents_title_trgm
 
 -- Chunks indexes
 CREATE INDEX IF NOT EXISTS idx_chunks_document_id ON chunks(document_id);
-CREATE INDEX IF NOT EXISTS idx_chunks_chunk_index ON chunks(document_id, chunk_index);
+-- Covering index for per-document chunk pagination (index-only scans)
+CREATE INDEX IF NOT EXISTS idx_chunks_document_chunk ON chunks(document_id, chunk_index)
+    INCLUDE (section_title, embedding_model_id);
 CREATE INDEX IF NOT EXISTS idx_chunks_section_type ON chunks(section_type);
 CREATE INDEX IF NOT EXISTS idx_chunks_content_hash ON chunks(content_hash);
 
--- HNSW vector index for semantic search (pgvector 0.5+)
+-- HNSW vector index for semantic search (halfvec requires pgvector 0.7+)
 -- HNSW provides better recall than IVFFlat without parameter tuning
 CREATE INDEX IF NOT EXISTS idx_chunks_embedding_hnsw
-    ON chunks USING hnsw (embedding vector_cosine_ops)
+    ON chunks USING hnsw (embedding halfvec_cosine_ops)
     WITH (m = 16, ef_construction = 64);
 
 -- Full-text search index for chunks
-CREATE INDEX IF NOT EXISTS idx_chunks_content_fts
-    ON chunks USING gin(to_tsvector('biomedical', content));
+CREATE INDEX IF NOT EXISTS idx_chunks_content_tsv
+    ON chunks USING gin(content_tsv);
 
 -- Processing jobs indexes
-CREATE INDEX IF NOT EXISTS idx_processing_jobs_status ON processing_jobs(status);
+-- Partial index for the job queue poller (highest priority, oldest first)
+CREATE INDEX IF NOT EXISTS idx_jobs_pending ON processing_jobs(priority DESC, created_at)
+    WHERE status IN ('pending', 'retrying');
 CREATE INDEX IF NOT EXISTS idx_processing_jobs_document_id ON processing_jobs(document_id);
 CREATE INDEX IF NOT EXISTS idx_processing_jobs_created_at ON processing_jobs(created_at);
 
@@ -264,7 +279,7 @@ $$ LANGUAGE plpgsql;
 
 -- Function for hybrid search (vector + keyword with RRF)
 CREATE OR REPLACE FUNCTION hybrid_search(
-    query_embedding vector(1536),
+    query_embedding halfvec(1536),
     query_text TEXT,
     match_count INTEGER DEFAULT 10,
     vector_weight FLOAT DEFAULT 0.7,
@@ -309,11 +324,11 @@ BEGIN
             c.document_id,
             c.content,
             c.section_title,
-            ts_rank(to_tsvector('biomedical', c.content), plainto_tsquery('biomedical', query_text)) as rank_score,
-            ROW_NUMBER() OVER (ORDER BY ts_rank(to_tsvector('biomedical', c.content), plainto_tsquery('biomedical', query_text)) DESC) as rank
+            ts_rank(c.content_tsv, plainto_tsquery('biomedical', query_text)) as rank_score,
+            ROW_NUMBER() OVER (ORDER BY ts_rank(c.content_tsv, plainto_tsquery('biomedical', query_text)) DESC) as rank
         FROM chunks c
         JOIN documents d ON c.document_id = d.id
-        WHERE to_tsvector('biomedical', c.content) @@ plainto_tsquery('biomedical', query_text)
+        WHERE c.content_tsv @@ plainto_tsquery('biomedical', query_text)
             AND d.processing_status = 'completed'
             AND (filter_journals IS NULL OR d.journal = ANY(filter_journals))
             AND (filter_date_from IS NULL OR d.publication_date >= filter_date_from)
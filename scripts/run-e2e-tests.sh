@@ -8,6 +8,7 @@
 #   ./scripts/run-e2e-tests.sh           # Run all E2E tests
 #   ./scripts/run-e2e-tests.sh -v        # Run with verbose output
 #   ./scripts/run-e2e-tests.sh -k "test_search"  # Run specific tests
+#   ./scripts/run-e2e-tests.sh -n auto   # Run in parallel (pytest-xdist)
 #
 # Prerequisites:
 #   - Docker and docker-compose installed
@@ -33,8 +33,8 @@ class Chunk:
     # Token information
     token_count: int = 0
 
-    # Hash for deduplication
-    content_hash: str = ""
+    # Raw SHA-256 digest for deduplication (stored as BYTEA)
+    content_hash: bytes = b""
 
     # Metadata
     metadata: dict[str, Any] = field(default_factory=dict)
@@ -44,7 +44,7 @@ class Chunk:
         if not self.content_hash:
             self.content_hash = hashlib.sha256(
                 self.content.encode("utf-8")
-            ).hexdigest()
+            ).digest()
 
 
 class ChunkingStrategy:
@@ -17,6 +17,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from services.shared.config import Settings, get_settings
+from services.shared.database import bulk_insert_chunks
 from services.shared.logging import get_logger
 from services.shared.models import Chunk as ChunkModel, Document, ProcessingStatus
 from services.shared.storage import S3Client, get_s3_client
@@ -158,7 +159,6 @@ class DocumentProcessor:
             # Step 8: Update document status
             document.processing_status = ProcessingStatus.COMPLETED
             document.processed_at = datetime.now(timezone.utc)
-            document.quality_score = document.calculate_quality_score()
 
             await self.db.commit()
 
@@ -326,35 +326,33 @@ class DocumentProcessor:
             delete(ChunkModel).where(ChunkModel.document_id == document_id)
         )
 
-        # Create new chunk records
-        chunk_models: list[ChunkModel] = []
-        previous_chunk_id: UUID | None = None
-
-        for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
-            chunk_model = ChunkModel(
-                id=uuid4(),
-                document_id=document_id,
-                content=chunk.content,
-                content_hash=chunk.content_hash,
-                section_title=chunk.section_title,
-                section_type=chunk.section_type,
-                chunk_index=chunk.chunk_index,
-                token_count=chunk.token_count,
-                embedding=embedding,
-                embedding_model_id=self.embedder.model_id,
-                embedding_version=1,
-                embedding_created_at=datetime.now(timezone.utc),
-                previous_chunk_id=previous_chunk_id,
-                extra_metadata=chunk.metadata,
-            )
-            self.db.add(chunk_model)
-            chunk_models.append(chunk_model)
-            previous_chunk_id = chunk_model.id
+        # Assign ids up front so neighbour links can be set before the COPY;
+        # self-referencing foreign keys are checked at the end of the statement
+        pairs = list(zip(chunks, embeddings, strict=True))
+        chunk_ids = [uuid4() for _ in pairs]
+        embedded_at = datetime.now(timezone.utc)
+        rows = [
+            {
+                "id": chunk_ids[i],
+                "document_id": document_id,
+                "content": chunk.content,
+                "content_hash": chunk.content_hash,
+                "section_title": chunk.section_title,
+                "section_type": chunk.section_type,
+                "chunk_index": chunk.chunk_index,
+                "token_count": chunk.token_count,
+                "embedding": embedding,
+                "embedding_model_id": self.embedder.model_id,
+                "embedding_version": 1,
+                "embedding_created_at": embedded_at,
+                "previous_chunk_id": chunk_ids[i - 1] if i > 0 else None,
+                "next_chunk_id": chunk_ids[i + 1] if i + 1 < len(chunk_ids) else None,
+                "extra_metadata": chunk.metadata,
+            }
+            for i, (chunk, embedding) in enumerate(pairs)
+        ]
 
-        # Update next_chunk_id references
-        await self.db.flush()
-        for i, chunk_model in enumerate(chunk_models[:-1]):
-            chunk_model.next_chunk_id = chunk_models[i + 1].id
+        await bulk_insert_chunks(self.db, rows)
 
     async def _mark_failed(
         self,
@@ -27,8 +27,8 @@ class TestChunk:
             content="Test content",
             chunk_index=0,
         )
-        assert chunk.content_hash != ""
-        assert len(chunk.content_hash) == 64  # SHA256 hex digest
+        assert isinstance(chunk.content_hash, bytes)
+        assert len(chunk.content_hash) == 32  # SHA256 raw digest
 
     def test_chunk_same_content_same_hash(self):
         """Same content should produce same hash."""
@@ -0,0 +1,160 @@
+"""
+Tests for the shared S3 client's existence checks.
+
+boto3 is replaced by a stubbed client, so no S3 endpoint is needed.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from services.shared.config import get_settings
+from services.shared.storage import S3Client
+
+
+def not_found() -> ClientError:
+    """Build the ClientError boto3 raises for a HEAD on a missing object."""
+    return ClientError(
+        {"Error": {"Code": "404"}, "ResponseMetadata": {"HTTPStatusCode": 404}},
+        "HeadObject",
+    )
+
+
+class StubS3:
+    """Minimal boto3 S3 client holding a fixed set of keys."""
+
+    def __init__(self, keys: set[str]):
+        self.keys = keys
+        self.head_object = MagicMock(side_effect=self._head_object)
+        self.list_calls = 0
+
+    def _head_object(self, Key: str, **_: object) -> dict:
+        if Key not in self.keys:
+            raise not_found()
+        return {}
+
+    def get_paginator(self, operation: str) -> MagicMock:
+        assert operation == "list_objects_v2"
+        self.list_calls += 1
+        paginator = MagicMock()
+        paginator.paginate.side_effect = self._paginate
+        return paginator
+
+    def _paginate(self, Prefix: str, PaginationConfig: dict, **_: object):
+        matching = sorted(key for key in self.keys if key.startswith(Prefix))
+        page_size = PaginationConfig["PageSize"]
+        for start in range(0, len(matching), page_size):
+            yield {
+                "Contents": [
+                    {"Key": key, "Size": 1, "LastModified": None, "ETag": '"e"'}
+                    for key in matching[start : start + page_size]
+                ]
+            }
+
+
+@pytest.fixture
+def stub():
+    """Stubbed boto3 client with a few stored documents."""
+    return StubS3({"papers/a.xml", "papers/b.xml", "papers/c.xml", "other/d.xml"})
+
+
+@pytest.fixture
+def s3(stub):
+    """S3Client backed by the stub, with a 300s hit and 30s miss TTL."""
+    settings = get_settings().model_copy(
+        update={
+            "s3_exists_cache_size": 100,
+            "s3_exists_cache_ttl": 300,
+            "s3_exists_cache_negative_ttl": 30,
+            "s3_max_concurrency": 2,
+        }
+    )
+    with patch.object(S3Client, "_create_client", return_value=stub):
+        return S3Client(settings)
+
+
+class TestDocumentsExist:
+    """Tests for S3Client.documents_exist."""
+
+    async def test_shared_prefix_uses_listing(self, s3, stub):
+        """Keys under a common prefix should be answered by one listing."""
+        result = await s3.documents_exist(["papers/a.xml", "papers/b.xml", "papers/x.xml"])
+
+        assert result == {"papers/a.xml": True, "papers/b.xml": True, "papers/x.xml": False}
+        assert stub.list_calls == 1
+        stub.head_object.assert_not_called()
+
+    async def test_no_common_prefix_uses_head(self, s3, stub):
+        """Keys without a common prefix should fall back to HEAD requests."""
+        result = await s3.documents_exist(["papers/a.xml", "other/d.xml", "missing.xml"])
+
+        assert result == {"papers/a.xml": True, "other/d.xml": True, "missing.xml": False}
+        assert stub.list_calls == 0
+        assert stub.head_object.call_count == 3
+
+    async def test_large_listing_falls_back_to_head(self, s3, stub):
+        """A prefix holding too many objects should stop listing and HEAD instead."""
+        stub.keys |= {f"papers/bulk/{i:05d}.xml" for i in range(2001)}
+
+        result = await s3.documents_exist(["papers/a.xml", "papers/x.xml"])
+
+        assert result == {"papers/a.xml": True, "papers/x.xml": False}
+        assert stub.list_calls == 1
+        assert stub.head_object.call_count == 2
+
+    async def test_results_are_cached(self, s3, stub):
+        """A second check should be served from the cache."""
+        await s3.documents_exist(["papers/a.xml", "other/d.xml"])
+        stub.head_object.reset_mock()
+
+        result = await s3.documents_exist(["papers/a.xml", "other/d.xml"])
+
+        assert result == {"papers/a.xml": True, "other/d.xml": True}
+        stub.head_object.assert_not_called()
+
+
+class TestDocumentExists:
+    """Tests for S3Client.document_exists and its cache."""
+
+    async def test_maps_404_to_false(self, s3):
+        """A 404 from HEAD should mean the document does not exist."""
+        assert await s3.document_exists("papers/a.xml") is True
+        assert await s3.document_exists("papers/x.xml") is False
+
+    async def test_other_errors_propagate(self, s3, stub):
+        """Errors other than 404 should not be reported as a missing document."""
+        stub.head_object.side_effect = ClientError(
+            {"Error": {"Code": "403"}, "ResponseMetadata": {"HTTPStatusCode": 403}},
+            "HeadObject",
+        )
+
+        with pytest.raises(ClientError):
+            await s3.document_exists("papers/a.xml")
+
+    async def test_positive_and_negative_ttls(self, s3, stub):
+        """Misses should expire after the negative TTL, hits after the positive TTL."""
+        with patch("services.shared.storage.time.monotonic", return_value=1000.0):
+            await s3.document_exists("papers/a.xml")
+            await s3.document_exists("papers/x.xml")
+        stub.keys = {"papers/x.xml"}
+        stub.head_object.reset_mock()
+
+        with patch("services.shared.storage.time.monotonic", return_value=1031.0):
+            assert await s3.document_exists("papers/a.xml") is True
+            assert await s3.document_exists("papers/x.xml") is True
+        assert stub.head_object.call_count == 1
+
+        with patch("services.shared.storage.time.monotonic", return_value=1301.0):
+            assert await s3.document_exists("papers/a.xml") is False
+        assert stub.head_object.call_count == 2
+
+    async def test_invalidate_exists(self, s3, stub):
+        """invalidate_exists should force the next check to hit S3."""
+        assert await s3.document_exists("papers/x.xml") is False
+        stub.keys.add("papers/x.xml")
+
+        assert await s3.document_exists("papers/x.xml") is False
+        s3.invalidate_exists("papers/x.xml")
+        assert await s3.document_exists("papers/x.xml") is True
+        assert stub.head_object.call_count == 2
@@ -0,0 +1,77 @@
+"""
+In-process response cache for idempotent retrieval endpoints.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+class ResponseCache:
+    """
+    Bounded LRU cache whose entries expire after a fixed time-to-live.
+
+    Entries live in process memory, so each worker keeps its own cache and
+    a cached response can be up to ``ttl`` seconds stale after new documents
+    are ingested. Only touched from the event loop, so no locking is needed.
+    """
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries (0 disables the cache)
+            ttl: Seconds an entry is served before it expires (0 disables the cache)
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether entries are stored at all."""
+        return self.max_size > 0 and self.ttl > 0
+
+    def get(self, key: Hashable) -> Any | None:
+        """
+        Return the cached value for a key, or None if absent or expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entries over max_size.
+
+        Args:
+            key: Cache key
+            value: Value to cache; must not be mutated afterwards
+        """
+        if not self.enabled:
+            return
+        self._entries[key] = (value, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
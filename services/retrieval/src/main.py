@@ -4,12 +4,13 @@ Retrieval Service - FastAPI Application Entry Point.
 Provides endpoints for search and RAG-powered chat.
 """
 
+import time
 from contextlib import asynccontextmanager
 from datetime import date
 from typing import Any
 from uuid import UUID
 
-from fastapi import Depends, FastAPI, HTTPException, Query, status
+from fastapi import Depends, FastAPI, HTTPException, Query, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -18,6 +19,7 @@ from services.shared.config import get_settings
 from services.shared.database import close_db, get_db, health_check as db_health_check, init_db
 from services.shared.logging import configure_logging, get_logger, LoggingMiddleware
 from services.shared.rate_limiter import rate_limit, RateLimitMiddleware
+from services.retrieval.src.cache import ResponseCache
 from services.retrieval.src.search import SearchService, SearchFilters as SearchFiltersData
 from services.retrieval.src.rag import RAGService
 
@@ -29,6 +31,10 @@ configure_logging(
 )
 logger = get_logger(__name__)
 
+# Exact-match cache for repeated searches; X-Cache reports HIT or MISS. Nothing
+# invalidates it on ingest, so the short TTL bounds how stale results can be.
+search_cache = ResponseCache(settings.retrieval_cache_size, settings.retrieval_cache_ttl)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -192,6 +198,7 @@ async def health_check() -> HealthResponse:
 @app.post("/search", response_model=SearchResponse, tags=["Search"])
 async def search(
     request: SearchRequest,
+    response: Response,
     db: AsyncSession = Depends(get_db),
     _rate_limit: None = Depends(rate_limit(limit=settings.rate_limit_search_per_minute, window_seconds=60)),
 ) -> SearchResponse:
@@ -200,6 +207,7 @@ async def search(
 
     Supports vector, keyword, and hybrid search modes with filtering.
     """
+    start_time = time.time()
     logger.info(
         "search_requested",
         query=request.query[:100],
@@ -207,6 +215,22 @@ async def search(
         limit=request.limit,
     )
 
+    # The serialized request covers the query, type, pagination and filters
+    cache_key = request.model_dump_json()
+    cached = search_cache.get(cache_key)
+    if isinstance(cached, SearchResponse):
+        response.headers["X-Cache"] = "HIT"
+        # Report this request's latency, not that of the search that filled the cache
+        return cached.model_copy(
+            update={
+                "query_metadata": {
+                    **cached.query_metadata,
+                    "took_ms": (time.time() - start_time) * 1000,
+                }
+            }
+        )
+    response.headers["X-Cache"] = "MISS"
+
     # Convert API filters to service filters
     filters = SearchFiltersData(
         date_from=request.filters.date_from,
@@ -261,7 +285,7 @@ async def search(
             )
         )
 
-    return SearchResponse(
+    api_response = SearchResponse(
         results=results,
         total=search_response.total,
         query_metadata={
@@ -270,6 +294,8 @@ async def search(
             "filters_applied": request.filters.model_dump(exclude_none=True),
         },
     )
+    search_cache.set(cache_key, api_response)
+    return api_response
 
 
 @app.post("/chat", response_model=ChatResponse, tags=["Chat"])
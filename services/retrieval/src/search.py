@@ -9,8 +9,9 @@ from datetime import date
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, select, text
+from sqlalchemy import ColumnClause, func, literal_column, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from services.shared.config import Settings, get_settings
 from services.shared.logging import get_logger
@@ -18,6 +19,11 @@ from services.shared.models import Chunk, Document
 
 logger = get_logger(__name__)
 
+# Text search configuration of the chunks.content_tsv generated column.
+# Inlined as a constant rather than a bound parameter so the query is parsed
+# with the same configuration the stored vectors were built with.
+_TS_CONFIG: ColumnClause[Any] = literal_column("'biomedical'::regconfig")
+
 
 @dataclass
 class SearchFilters:
@@ -193,21 +199,13 @@ class SearchService:
     ) -> list[SearchResult]:
         """Perform keyword search using PostgreSQL full-text search."""
         # Use PostgreSQL's plainto_tsquery for simple query parsing
+        tsquery = func.plainto_tsquery(_TS_CONFIG, query)
+        rank = func.ts_rank(Chunk.content_tsv, tsquery)
+
         stmt = (
-            select(
-                Chunk,
-                Document,
-                func.ts_rank(
-                    func.to_tsvector("english", Chunk.content),
-                    func.plainto_tsquery("english", query),
-                ).label("score"),
-            )
+            select(Chunk, Document, rank.label("score"))
             .join(Document, Chunk.document_id == Document.id)
-            .where(
-                func.to_tsvector("english", Chunk.content).op("@@")(
-                    func.plainto_tsquery("english", query)
-                )
-            )
+            .where(Chunk.content_tsv.op("@@")(tsquery))
             .where(Document.processing_status == "completed")
         )
 
@@ -215,16 +213,7 @@ class SearchService:
         stmt = self._apply_filters(stmt, filters)
 
         # Order by rank and paginate
-        stmt = (
-            stmt.order_by(
-                func.ts_rank(
-                    func.to_tsvector("english", Chunk.content),
-                    func.plainto_tsquery("english", query),
-                ).desc()
-            )
-            .offset(offset)
-            .limit(limit)
-        )
+        stmt = stmt.order_by(rank.desc()).offset(offset).limit(limit)
 
         result = await self.db.execute(stmt)
         rows = result.all()
@@ -256,7 +245,7 @@ class SearchService:
         filter_date_to = filters.date_to
 
         # Use the hybrid_search function defined in init-db.sql
-        # Note: We use CAST() instead of ::vector to avoid asyncpg parameter binding issues
+        # Note: We use CAST() instead of ::halfvec to avoid asyncpg parameter binding issues
         stmt = text("""
             SELECT
                 hs.chunk_id,
@@ -272,7 +261,7 @@ class SearchService:
                 d.doi,
                 d.pmcid
             FROM hybrid_search(
-                CAST(:query_embedding AS vector),
+                CAST(:query_embedding AS halfvec),
                 :query_text,
                 :match_count,
                 :vector_weight,
@@ -373,24 +362,41 @@ class SearchService:
         limit: int = 50,
         offset: int = 0,
     ) -> tuple[list[Chunk], int]:
-        """Get chunks for a document."""
-        # Get total count
-        count_result = await self.db.execute(
-            select(func.count(Chunk.id)).where(Chunk.document_id == document_id)
-        )
-        total = count_result.scalar() or 0
+        """
+        Get chunks for a document.
 
-        # Get chunks
+        Only the listing columns are loaded (id, content, section_title,
+        chunk_index, token_count); other attributes, notably the embedding,
+        are left unloaded and must not be accessed on the returned chunks.
+        """
+        # The window count is computed before OFFSET/LIMIT, so one round trip
+        # returns both the page and the document's total chunk count
         result = await self.db.execute(
-            select(Chunk)
+            select(Chunk, func.count().over().label("total"))
+            .options(
+                load_only(
+                    Chunk.content,
+                    Chunk.section_title,
+                    Chunk.chunk_index,
+                    Chunk.token_count,
+                )
+            )
             .where(Chunk.document_id == document_id)
             .order_by(Chunk.chunk_index)
             .offset(offset)
             .limit(limit)
         )
-        chunks = result.scalars().all()
+        rows = result.all()
+        if rows:
+            return [row[0] for row in rows], rows[0].total
 
-        return list(chunks), total
+        # An empty page carries no count; only needed past the last chunk
+        if offset == 0:
+            return [], 0
+        count_result = await self.db.execute(
+            select(func.count(Chunk.id)).where(Chunk.document_id == document_id)
+        )
+        return [], count_result.scalar() or 0
 
 
 def get_search_service(
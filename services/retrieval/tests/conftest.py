@@ -120,10 +120,11 @@ def test_settings() -> Settings:
 @pytest.fixture
 def client() -> Generator[TestClient, None, None]:
     """Create test client for sync tests with mocked database."""
-    from services.retrieval.src.main import app
+    from services.retrieval.src.main import app, search_cache
 
-    # Reset test data for each test
+    # Reset test data and cached responses for each test
     reset_test_data()
+    search_cache.clear()
 
     # Override database dependency
     app.dependency_overrides[get_db] = override_get_db
@@ -92,6 +92,25 @@ class TestSearchEndpoint:
         data = response.json()
         assert data["query_metadata"]["retrieval_strategy"] == "keyword"
 
+    def test_search_repeated_request_is_cached(self, client: TestClient):
+        """An identical search should be served from the response cache."""
+        request = {"query": "biosensor", "search_type": "keyword", "limit": 5}
+
+        first = client.post("/search", json=request)
+        second = client.post("/search", json=request)
+        different = client.post("/search", json={**request, "limit": 6})
+
+        assert first.headers["X-Cache"] == "MISS"
+        assert second.headers["X-Cache"] == "HIT"
+        assert different.headers["X-Cache"] == "MISS"
+
+        # A hit replays the results but reports its own latency
+        first_data, second_data = first.json(), second.json()
+        assert "took_ms" in second_data["query_metadata"]
+        first_data["query_metadata"].pop("took_ms")
+        second_data["query_metadata"].pop("took_ms")
+        assert second_data == first_data
+
 
 class TestDocumentsEndpoint:
     """Tests for /documents endpoints."""
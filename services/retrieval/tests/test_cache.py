@@ -0,0 +1,50 @@
+"""
+Tests for the retrieval response cache.
+"""
+
+from unittest.mock import patch
+
+from services.retrieval.src.cache import ResponseCache
+
+
+class TestResponseCache:
+    """Tests for ResponseCache."""
+
+    def test_returns_stored_value(self):
+        """A stored value should be returned for the same key."""
+        cache = ResponseCache(max_size=10, ttl=60)
+        cache.set("query", {"results": []})
+
+        assert cache.get("query") == {"results": []}
+        assert cache.get("other") is None
+
+    def test_entries_expire_after_ttl(self):
+        """Entries should not be served once their TTL has elapsed."""
+        cache = ResponseCache(max_size=10, ttl=60)
+        with patch("services.retrieval.src.cache.time.monotonic", return_value=1000.0):
+            cache.set("query", "value")
+        with patch("services.retrieval.src.cache.time.monotonic", return_value=1059.0):
+            assert cache.get("query") == "value"
+        with patch("services.retrieval.src.cache.time.monotonic", return_value=1060.0):
+            assert cache.get("query") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        """The least recently used entry should be evicted past max_size."""
+        cache = ResponseCache(max_size=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_zero_size_or_ttl_disables_cache(self):
+        """A zero size or TTL should store nothing."""
+        for cache in (ResponseCache(max_size=0, ttl=60), ResponseCache(max_size=10, ttl=0)):
+            cache.set("query", "value")
+
+            assert cache.get("query") is None
+            assert len(cache) == 0
@@ -47,9 +47,39 @@ class Settings(BaseSettings):
                 "Set DATABASE_URL environment variable with secure credentials."
             )
         return v
-    database_pool_size: int = Field(default=5, ge=1, le=50)
-    database_max_overflow: int = Field(default=10, ge=0, le=50)
-    database_pool_timeout: int = Field(default=30, ge=5, le=300)
+    # Pools are per worker process: peak connections per service are
+    # api_workers * (database_pool_size + database_max_overflow), and the sum
+    # across all services must stay below Postgres max_connections.
+    database_pool_size: int = Field(default=20, ge=1, le=50)
+    database_max_overflow: int = Field(default=30, ge=0, le=50)
+    database_pool_timeout: int = Field(default=10, ge=5, le=300)
+    database_pool_pre_ping: bool = Field(
+        default=False,
+        description="Ping every connection on checkout (one extra round-trip per session)",
+    )
+    database_pool_recycle: int = Field(
+        default=1800,
+        ge=-1,
+        description="Retire pooled connections older than this many seconds (-1 disables)",
+    )
+    database_pool_ping_interval: int = Field(
+        default=0,
+        ge=0,
+        le=3600,
+        description="Ping connections idle in the pool longer than this many seconds (0 disables)",
+    )
+    database_jit: bool = Field(
+        default=False,
+        description="Allow PostgreSQL JIT compilation (adds planning latency to short queries)",
+    )
+    database_prepared_statement_cache_size: int = Field(
+        default=100,
+        ge=0,
+        description=(
+            "Prepared statements kept in the asyncpg dialect's per-connection LRU, "
+            "so repeated queries skip parse and plan (0 disables)"
+        ),
+    )
     database_echo: bool = Field(default=False, description="Echo SQL statements")
 
     # =========================================================================
@@ -69,6 +99,64 @@ class Settings(BaseSettings):
     # =========================================================================
     s3_bucket_raw_documents: str = "biomedical-raw-documents"
     s3_bucket_processed_chunks: str = "biomedical-processed-chunks"
+    s3_multipart_threshold: int = Field(
+        default=8 * 1024 * 1024,
+        ge=5 * 1024 * 1024,
+        description="Object size in bytes above which transfers use multipart",
+    )
+    s3_multipart_chunksize: int = Field(
+        default=8 * 1024 * 1024,
+        ge=5 * 1024 * 1024,
+        description="Part size in bytes for multipart transfers",
+    )
+    s3_max_concurrency: int = Field(
+        default=10,
+        ge=1,
+        le=64,
+        description="Parts transferred in parallel per upload or download",
+    )
+    # "adaptive" adds client-side rate limiting on top of "standard" retries;
+    # only worth enabling for workers that routinely hit S3 throttling
+    s3_retry_mode: Literal["standard", "adaptive"] = "standard"
+    s3_retry_max_attempts: int = Field(default=5, ge=1, le=10)
+    s3_max_pool_connections: int = Field(
+        default=32,
+        ge=1,
+        le=256,
+        description="HTTP connections kept per S3 client (shared by all concurrent calls)",
+    )
+    s3_presigned_url_cache_size: int = Field(
+        default=10_000,
+        ge=0,
+        description="Presigned URLs kept for reuse (0 disables the cache)",
+    )
+    s3_presigned_url_min_ttl: int = Field(
+        default=300,
+        ge=0,
+        description="Minimum remaining lifetime in seconds for a cached presigned URL",
+    )
+    s3_exists_cache_size: int = Field(
+        default=10_000,
+        ge=0,
+        description="Object existence results kept for reuse (0 disables the cache)",
+    )
+    s3_exists_cache_ttl: int = Field(
+        default=300,
+        ge=0,
+        description="Seconds a cached 'object exists' result is trusted",
+    )
+    s3_exists_cache_negative_ttl: int = Field(
+        default=30,
+        ge=0,
+        description="Seconds a cached 'object missing' result is trusted",
+    )
+    # "when_supported" (botocore's default) checksums every upload part and
+    # validates every download; "when_required" leaves integrity to TLS and only
+    # checksums the operations S3 requires it for
+    s3_checksum_calculation: Literal["when_supported", "when_required"] = "when_required"
+    # Explicit checksum for uploads, stored with the object; CRC32C needs
+    # botocore[crt] (awscrt) installed
+    s3_upload_checksum_algorithm: Literal["CRC32", "CRC32C"] | None = None
 
     # =========================================================================
     # SQS Configuration
@@ -117,7 +205,17 @@ class Settings(BaseSettings):
     # =========================================================================
     retrieval_default_limit: int = Field(default=10, ge=1, le=100)
     retrieval_max_limit: int = Field(default=100, ge=10, le=1000)
-    retrieval_cache_ttl: int = Field(default=3600, ge=0, le=86400)
+    retrieval_cache_ttl: int = Field(
+        default=30,
+        ge=0,
+        le=3600,
+        description="Seconds a cached search response is served (0 disables the cache)",
+    )
+    retrieval_cache_size: int = Field(
+        default=1000,
+        ge=0,
+        description="Search responses kept per process (0 disables the cache)",
+    )
 
     # =========================================================================
     # Search Configuration
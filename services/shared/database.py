@@ -4,11 +4,17 @@ Database connection and session management for Oros.
 Uses SQLAlchemy 2.0 async patterns with connection pooling.
 """
 
-from collections.abc import AsyncGenerator
+import threading
+import time
+from collections.abc import AsyncGenerator, Sequence
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import Any
 
-from sqlalchemy import event, text
+import orjson
+from pgvector import HalfVector
+from sqlalchemy import Table, event, exc, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -34,6 +40,20 @@ class Base(DeclarativeBase):
 _engine: AsyncEngine | None = None
 _session_factory: async_sessionmaker[AsyncSession] | None = None
 
+# Guard lazy initialization so concurrent first calls cannot build (and leak)
+# a second engine with its own pool
+_engine_lock = threading.Lock()
+_session_factory_lock = threading.Lock()
+
+# Set once init_db has confirmed the pgvector extension is installed
+_pgvector_verified = False
+
+_INIT_CHECK_SQL = text("SELECT current_setting('max_connections')::int AS max_connections")
+_INIT_CHECK_WITH_PGVECTOR_SQL = text(
+    "SELECT current_setting('max_connections')::int AS max_connections, "
+    "EXISTS(SELECT 1 FROM pg_extension WHERE extname = 'vector') AS has_vector"
+)
+
 
 def get_engine(settings: Settings | None = None) -> AsyncEngine:
     """
@@ -48,40 +68,111 @@ def get_engine(settings: Settings | None = None) -> AsyncEngine:
     global _engine
 
     if _engine is None:
-        if settings is None:
-            settings = get_settings()
+        with _engine_lock:
+            if _engine is None:
+                _engine = _create_engine(settings or get_settings())
 
-        _engine = create_async_engine(
-            settings.async_database_url,
-            poolclass=AsyncAdaptedQueuePool,
-            pool_size=settings.database_pool_size,
-            max_overflow=settings.database_max_overflow,
-            pool_timeout=settings.database_pool_timeout,
-            pool_pre_ping=True,  # Verify connections before use
-            echo=settings.database_echo,
-        )
+    return _engine
 
-        # Log pool events in debug mode
-        if settings.is_development:
-            from sqlalchemy.pool import PoolProxiedConnection
-            from sqlalchemy.pool.base import ConnectionPoolEntry
-
-            @event.listens_for(_engine.sync_engine, "checkout")
-            def receive_checkout(
-                dbapi_connection: Any,
-                connection_record: ConnectionPoolEntry,
-                connection_proxy: PoolProxiedConnection,
-            ) -> None:
-                logger.debug("connection_checkout", pool_size=_engine.pool.size())
-
-            @event.listens_for(_engine.sync_engine, "checkin")
-            def receive_checkin(
-                dbapi_connection: Any,
-                connection_record: ConnectionPoolEntry,
-            ) -> None:
-                logger.debug("connection_checkin", pool_size=_engine.pool.size())
 
-    return _engine
+def _create_engine(settings: Settings) -> AsyncEngine:
+    """
+    Build the async engine and attach pool event listeners.
+
+    Args:
+        settings: Settings to configure the engine from
+
+    Returns:
+        Configured async SQLAlchemy engine
+    """
+    engine = create_async_engine(
+        settings.async_database_url,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_timeout=settings.database_pool_timeout,
+        pool_pre_ping=settings.database_pool_pre_ping,
+        pool_recycle=settings.database_pool_recycle,
+        echo=settings.database_echo,
+        # JIT compilation costs more than it saves on short OLTP and
+        # top-k vector queries; set per connection via asyncpg startup params.
+        # Statements are prepared once per pooled connection and reused while
+        # they stay in the dialect's LRU cache.
+        connect_args={
+            "server_settings": {"jit": "on" if settings.database_jit else "off"},
+            "prepared_statement_cache_size": settings.database_prepared_statement_cache_size,
+        },
+    )
+
+    register_halfvec_codec(engine)
+
+    # Cheaper alternative to pool_pre_ping: only ping connections that
+    # have sat idle in the pool longer than the configured interval
+    if settings.database_pool_ping_interval and not settings.database_pool_pre_ping:
+        _register_interval_ping(engine, settings.database_pool_ping_interval)
+
+    # Log pool events in debug mode
+    if settings.is_development:
+        from sqlalchemy.pool import PoolProxiedConnection
+        from sqlalchemy.pool.base import ConnectionPoolEntry
+
+        @event.listens_for(engine.sync_engine, "checkout")
+        def receive_checkout(
+            dbapi_connection: Any,
+            connection_record: ConnectionPoolEntry,
+            connection_proxy: PoolProxiedConnection,
+        ) -> None:
+            logger.debug("connection_checkout", pool_size=engine.pool.size())
+
+        @event.listens_for(engine.sync_engine, "checkin")
+        def receive_checkin(
+            dbapi_connection: Any,
+            connection_record: ConnectionPoolEntry,
+        ) -> None:
+            logger.debug("connection_checkin", pool_size=engine.pool.size())
+
+    return engine
+
+
+def _register_interval_ping(engine: AsyncEngine, interval: int) -> None:
+    """
+    Ping pooled connections on checkout only if they have been idle too long.
+
+    Args:
+        engine: Engine whose pool should be instrumented
+        interval: Minimum idle time in seconds before a connection is pinged
+    """
+    from sqlalchemy.pool import PoolProxiedConnection
+    from sqlalchemy.pool.base import ConnectionPoolEntry
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def receive_connect(dbapi_connection: Any, connection_record: ConnectionPoolEntry) -> None:
+        connection_record.info["last_ping"] = time.monotonic()
+
+    @event.listens_for(engine.sync_engine, "checkin")
+    def receive_checkin(dbapi_connection: Any, connection_record: ConnectionPoolEntry) -> None:
+        # A connection that made it back to the pool was alive a moment ago
+        connection_record.info["last_ping"] = time.monotonic()
+
+    @event.listens_for(engine.sync_engine, "checkout")
+    def receive_checkout(
+        dbapi_connection: Any,
+        connection_record: ConnectionPoolEntry,
+        connection_proxy: PoolProxiedConnection,
+    ) -> None:
+        now = time.monotonic()
+        if now - connection_record.info.get("last_ping", 0.0) < interval:
+            return
+
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute("SELECT 1")
+        except Exception:
+            # Tells the pool to discard this connection and retry with a fresh one
+            raise exc.DisconnectionError()
+        finally:
+            cursor.close()
+        connection_record.info["last_ping"] = now
 
 
 def get_session_factory(settings: Settings | None = None) -> async_sessionmaker[AsyncSession]:
@@ -97,14 +188,15 @@ def get_session_factory(settings: Settings | None = None) -> async_sessionmaker[
     global _session_factory
 
     if _session_factory is None:
-        engine = get_engine(settings)
-        _session_factory = async_sessionmaker(
-            bind=engine,
-            class_=AsyncSession,
-            expire_on_commit=False,
-            autocommit=False,
-            autoflush=False,
-        )
+        with _session_factory_lock:
+            if _session_factory is None:
+                _session_factory = async_sessionmaker(
+                    bind=get_engine(settings),
+                    class_=AsyncSession,
+                    expire_on_commit=False,
+                    autocommit=False,
+                    autoflush=False,
+                )
 
     return _session_factory
 
@@ -159,6 +251,104 @@ async def DatabaseSession() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+_VECTOR_SCHEMA_SQL = (
+    "SELECT extnamespace::regnamespace::text FROM pg_extension WHERE extname = 'vector'"
+)
+
+
+def _encode_halfvec(value: Any) -> bytes:
+    """Encode a halfvec parameter in pgvector's binary format."""
+    if isinstance(value, str):
+        # HALFVEC bind parameters and CAST(:param AS halfvec) arrive as text
+        return HalfVector.from_text(value).to_binary()
+    return (value if isinstance(value, HalfVector) else HalfVector(value)).to_binary()
+
+
+def register_halfvec_codec(engine: AsyncEngine) -> None:
+    """
+    Install a binary halfvec codec on every new connection of an engine.
+
+    COPY needs a binary encoder for every column and asyncpg has none for
+    halfvec. Registering it once per connection keeps bulk_insert_chunks free
+    of per-call codec round trips, which would also flush asyncpg's statement
+    cache. The codec accepts the text form SQLAlchemy's HALFVEC type binds, and
+    decodes to HalfVector, which that type converts to a list.
+
+    Args:
+        engine: Engine whose connections should get the codec
+    """
+    from sqlalchemy.pool.base import ConnectionPoolEntry
+
+    async def register(driver_connection: Any) -> None:
+        # pgvector can live in any schema; skip if the extension is missing
+        schema = await driver_connection.fetchval(_VECTOR_SCHEMA_SQL)
+        if schema is None:
+            return
+        await driver_connection.set_type_codec(
+            "halfvec",
+            schema=schema,
+            encoder=_encode_halfvec,
+            decoder=HalfVector.from_binary,
+            format="binary",
+        )
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def receive_connect(dbapi_connection: Any, connection_record: ConnectionPoolEntry) -> None:
+        dbapi_connection.run_async(register)
+
+
+@lru_cache
+def _jsonb_columns(table: Table) -> frozenset[str]:
+    """Names of a table's jsonb columns, whose values COPY takes as JSON text."""
+    return frozenset(column.name for column in table.columns if isinstance(column.type, JSONB))
+
+
+async def bulk_insert_chunks(session: AsyncSession, rows: Sequence[dict[str, Any]]) -> None:
+    """
+    Insert chunk rows with a binary COPY on the session's connection.
+
+    Runs inside the session's current transaction, but bypasses the ORM: rows
+    are not added to the identity map and only Python-side column defaults are
+    skipped. Server defaults (such as the generated id) still apply to omitted
+    columns, so callers need only supply values Python would have generated.
+    The session's engine must have register_halfvec_codec applied (engines
+    from get_engine do) for embeddings to be copied.
+
+    Args:
+        session: Session whose connection and transaction to use
+        rows: Column name to value mappings, all with the same keys. Embeddings
+            may be lists of floats; jsonb values are serialized to JSON.
+    """
+    # Imported here: the models module imports Base from this one
+    from services.shared.models import Chunk
+
+    if not rows:
+        return
+
+    jsonb_columns = _jsonb_columns(Chunk.__table__)
+    columns = list(rows[0])
+    records = [
+        tuple(
+            (
+                orjson.dumps(row[column], option=orjson.OPT_NON_STR_KEYS).decode()
+                if column in jsonb_columns
+                else row[column]
+            )
+            for column in columns
+        )
+        for row in rows
+    ]
+
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    driver_connection = raw_connection.driver_connection
+    if driver_connection is None:
+        raise RuntimeError("Database connection is no longer available for COPY")
+    await driver_connection.copy_records_to_table(
+        Chunk.__tablename__, records=records, columns=columns
+    )
+
+
 async def init_db(settings: Settings | None = None) -> None:
     """
     Initialize database connection and verify connectivity.
@@ -166,20 +356,36 @@ async def init_db(settings: Settings | None = None) -> None:
     Args:
         settings: Optional settings override
     """
+    global _pgvector_verified
+
+    if settings is None:
+        settings = get_settings()
+
     engine = get_engine(settings)
     async with engine.begin() as conn:
-        # Verify connection
-        await conn.execute(text("SELECT 1"))
+        # Verify connection, read the server connection limit and check for
+        # pgvector in a single round-trip (the extension check is skipped once
+        # it has passed in this process)
+        if _pgvector_verified:
+            row = (await conn.execute(_INIT_CHECK_SQL)).one()
+        else:
+            row = (await conn.execute(_INIT_CHECK_WITH_PGVECTOR_SQL)).one()
         logger.info("database_connected", url=str(engine.url).split("@")[-1])
 
-        # Verify pgvector extension
-        result = await conn.execute(
-            text("SELECT extname FROM pg_extension WHERE extname = 'vector'")
+        # Surface pool sizing against the server limit so mis-sized pools are visible at boot
+        logger.info(
+            "pool_configured",
+            size=settings.database_pool_size,
+            max_overflow=settings.database_max_overflow,
+            pg_max_connections=row.max_connections,
         )
-        if result.scalar() is None:
-            logger.warning("pgvector_extension_missing")
-        else:
-            logger.info("pgvector_extension_verified")
+
+        if not _pgvector_verified:
+            if row.has_vector:
+                _pgvector_verified = True
+                logger.info("pgvector_extension_verified")
+            else:
+                logger.warning("pgvector_extension_missing")
 
 
 async def close_db() -> None:
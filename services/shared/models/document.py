@@ -2,25 +2,29 @@
 SQLAlchemy ORM models for documents and chunks.
 """
 
+import warnings
 from datetime import date, datetime
 from enum import Enum
 from typing import Any
 from uuid import UUID, uuid4
 
-from pgvector.sqlalchemy import Vector
+from pgvector.sqlalchemy import HALFVEC
 from sqlalchemy import (
     Boolean,
+    Computed,
     Date,
     DateTime,
     Float,
     ForeignKey,
     Index,
     Integer,
+    LargeBinary,
     String,
     Text,
     func,
+    text,
 )
-from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID as PG_UUID
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR, UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from services.shared.database import Base
@@ -52,6 +56,18 @@ class SearchType(str, Enum):
     HYBRID = "hybrid"
 
 
+# Document completeness score, computed by Postgres as a stored generated column.
+# Mirrors Document.calculate_quality_score().
+QUALITY_SCORE_SQL = (
+    "ROUND(("
+    "CASE WHEN has_abstract THEN 0.3 ELSE 0 END"
+    " + CASE WHEN has_full_text THEN 0.3 ELSE 0 END"
+    " + LEAST(COALESCE(section_count, 0) / 5.0, 1.0) * 0.2"
+    " + LEAST(COALESCE(reference_count, 0) / 20.0, 1.0) * 0.2"
+    ")::numeric, 2)::double precision"
+)
+
+
 class Document(Base):
     """
     Represents a biomedical document (paper, article).
@@ -61,9 +77,13 @@ class Document(Base):
 
     __tablename__ = "documents"
 
+    # Fetch server-generated values (quality_score, timestamps) via RETURNING
+    # so they are populated after flush without a lazy load
+    __mapper_args__ = {"eager_defaults": True}
+
     # Primary key
     id: Mapped[UUID] = mapped_column(
-        PG_UUID(as_uuid=True), primary_key=True, default=uuid4
+        PG_UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
     )
 
     # Core metadata
@@ -79,8 +99,8 @@ class Document(Base):
     pmid: Mapped[str | None] = mapped_column(String(50))
 
     # Classification
-    mesh_terms: Mapped[list[str]] = mapped_column(JSONB, default=list)
-    keywords: Mapped[list[str]] = mapped_column(JSONB, default=list)
+    mesh_terms: Mapped[list[str]] = mapped_column(ARRAY(Text), default=list)
+    keywords: Mapped[list[str]] = mapped_column(ARRAY(Text), default=list)
     article_type: Mapped[str | None] = mapped_column(String(100))
 
     # Source and storage
@@ -96,7 +116,9 @@ class Document(Base):
     processing_attempts: Mapped[int] = mapped_column(Integer, default=0)
 
     # Quality metrics
-    quality_score: Mapped[float | None] = mapped_column(Float)
+    quality_score: Mapped[float] = mapped_column(
+        Float, Computed(QUALITY_SCORE_SQL, persisted=True), nullable=False
+    )
     has_abstract: Mapped[bool] = mapped_column(Boolean, default=False)
     has_full_text: Mapped[bool] = mapped_column(Boolean, default=False)
     section_count: Mapped[int] = mapped_column(Integer, default=0)
@@ -121,15 +143,33 @@ class Document(Base):
     processed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
 
     # Relationships
+    # Chunks carry 1536-dim embeddings, so never load them implicitly: callers
+    # that need them use .options(selectinload(Document.chunks)) to fetch all
+    # documents' chunks in one batched SELECT instead of one query per document.
+    # Deletes rely on the ON DELETE CASCADE foreign key.
     chunks: Mapped[list["Chunk"]] = relationship(
-        "Chunk", back_populates="document", cascade="all, delete-orphan"
+        "Chunk",
+        back_populates="document",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     processing_jobs: Mapped[list["ProcessingJob"]] = relationship(
         "ProcessingJob", back_populates="document", cascade="all, delete-orphan"
     )
 
     def calculate_quality_score(self) -> float:
-        """Calculate quality score based on document completeness."""
+        """
+        Calculate quality score based on document completeness.
+
+        Deprecated: quality_score is a generated column maintained by Postgres.
+        Kept as a Python fallback for objects that have not been flushed yet.
+        """
+        warnings.warn(
+            "calculate_quality_score() is deprecated; read Document.quality_score instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
         score = 0.0
 
         if self.has_abstract:
@@ -158,7 +198,12 @@ class Chunk(Base):
 
     # Primary key
     id: Mapped[UUID] = mapped_column(
-        PG_UUID(as_uuid=True), primary_key=True, default=uuid4
+        PG_UUID(as_uuid=True),
+        primary_key=True,
+        # Keep the client-side default: SQLAlchemy uses it as the insertmanyvalues
+        # sentinel, without which bulk chunk inserts degrade to one INSERT per row
+        default=uuid4,
+        server_default=text("gen_random_uuid()"),
     )
 
     # Foreign key to document
@@ -171,7 +216,13 @@ class Chunk(Base):
 
     # Content
     content: Mapped[str] = mapped_column(Text, nullable=False)
-    content_hash: Mapped[str | None] = mapped_column(String(64), index=True)
+    content_hash: Mapped[bytes | None] = mapped_column(LargeBinary(32), index=True)
+    # Generated by Postgres for keyword search; deferred so chunk SELECTs skip it
+    content_tsv: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed("to_tsvector('biomedical'::regconfig, content)", persisted=True),
+        deferred=True,
+    )
 
     # Position and structure
     section_title: Mapped[str | None] = mapped_column(String(500))
@@ -183,7 +234,7 @@ class Chunk(Base):
     token_count: Mapped[int | None] = mapped_column(Integer)
 
     # Embedding with versioning (1536 dimensions for Bedrock Titan)
-    embedding: Mapped[list[float] | None] = mapped_column(Vector(1536))
+    embedding: Mapped[list[float] | None] = mapped_column(HALFVEC(1536))
     embedding_model_id: Mapped[str | None] = mapped_column(String(100))
     embedding_version: Mapped[int] = mapped_column(Integer, default=1)
     embedding_created_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
@@ -223,7 +274,7 @@ class ProcessingJob(Base):
 
     # Primary key
     id: Mapped[UUID] = mapped_column(
-        PG_UUID(as_uuid=True), primary_key=True, default=uuid4
+        PG_UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
     )
 
     # Foreign key to document
@@ -283,12 +334,12 @@ class SearchHistory(Base):
 
     # Primary key
     id: Mapped[UUID] = mapped_column(
-        PG_UUID(as_uuid=True), primary_key=True, default=uuid4
+        PG_UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
     )
 
     # Query details
     query_text: Mapped[str] = mapped_column(Text, nullable=False)
-    query_embedding: Mapped[list[float] | None] = mapped_column(Vector(1536))
+    query_embedding: Mapped[list[float] | None] = mapped_column(HALFVEC(1536))
     search_type: Mapped[SearchType] = mapped_column(String(20), nullable=False)
 
     # Filters applied
@@ -316,4 +367,24 @@ class SearchHistory(Base):
 
 # Table indexes (defined in init-db.sql, but also declared here for clarity)
 Index("idx_documents_publication_date", Document.publication_date)
-Index("idx_chunks_document_chunk", Chunk.document_id, Chunk.chunk_index)
+Index("idx_documents_mesh_terms", Document.mesh_terms, postgresql_using="gin")
+# Partial indexes for the work-queue hot path: only unfinished rows are indexed
+_QUEUED_STATUSES = [ProcessingStatus.PENDING.value, ProcessingStatus.RETRYING.value]
+Index(
+    "idx_documents_pending",
+    Document.created_at,
+    postgresql_where=Document.processing_status.in_(_QUEUED_STATUSES),
+)
+Index(
+    "idx_jobs_pending",
+    ProcessingJob.priority.desc(),
+    ProcessingJob.created_at,
+    postgresql_where=ProcessingJob.status.in_(_QUEUED_STATUSES),
+)
+# Covering index for per-document chunk pagination (index-only scans)
+Index(
+    "idx_chunks_document_chunk",
+    Chunk.document_id,
+    Chunk.chunk_index,
+    postgresql_include=["section_title", "embedding_model_id"],
+)
@@ -4,11 +4,20 @@ S3 storage client for Oros.
 Handles document storage and retrieval from S3 with LocalStack support.
 """
 
-from datetime import timedelta
+import asyncio
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, AsyncIterator, Mapping
+from contextlib import aclosing
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from io import BytesIO
 from typing import Any, BinaryIO
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config
 from botocore.exceptions import ClientError
 
@@ -17,12 +26,32 @@ from services.shared.logging import get_logger
 
 logger = get_logger(__name__)
 
+# ListObjectsV2 returns at most this many keys per call
+_LIST_PAGE_SIZE = 1000
+
+# Upper bound on objects listed by documents_exist before falling back to HEADs
+_EXISTS_LIST_LIMIT = 5000
+
+
+@dataclass(frozen=True, slots=True)
+class S3ObjectMetadata:
+    """Metadata returned by a HEAD request on an S3 object."""
+
+    content_type: str | None
+    content_length: int | None
+    last_modified: datetime | None
+    etag: str | None
+    metadata: Mapping[str, str]
+
 
 class S3Client:
     """
     S3 client wrapper with support for LocalStack in development.
 
     Provides methods for uploading, downloading, and managing documents in S3.
+    boto3 is blocking, so every network call runs in a worker thread via
+    asyncio.to_thread to keep the event loop free; the boto3 client itself is
+    thread-safe and shared.
     """
 
     def __init__(self, settings: Settings | None = None):
@@ -33,14 +62,42 @@ class S3Client:
             settings: Optional settings override
         """
         self.settings = settings or get_settings()
+        self._default_bucket = self.settings.s3_bucket_raw_documents
         self._client = self._create_client()
+        self._transfer_config = TransferConfig(
+            multipart_threshold=self.settings.s3_multipart_threshold,
+            multipart_chunksize=self.settings.s3_multipart_chunksize,
+            max_concurrency=self.settings.s3_max_concurrency,
+            use_threads=True,
+        )
+
+        # (bucket, key, method, expires_in) -> (url, monotonic expiry time)
+        self._presigned_urls: OrderedDict[tuple[str, str, str, int], tuple[str, float]] = (
+            OrderedDict()
+        )
+        self._presigned_urls_lock = threading.Lock()
+
+        # (bucket, key) -> (exists, monotonic expiry time)
+        self._exists_cache: OrderedDict[tuple[str, str], tuple[bool, float]] = OrderedDict()
+        self._exists_cache_lock = threading.Lock()
 
     def _create_client(self) -> Any:
         """Create boto3 S3 client with appropriate configuration."""
         config = Config(
-            retries={"max_attempts": 3, "mode": "adaptive"},
+            retries={
+                "max_attempts": self.settings.s3_retry_max_attempts,
+                "mode": self.settings.s3_retry_mode,
+            },
             connect_timeout=5,
             read_timeout=30,
+            # Shared by every concurrent call and multipart transfer thread; never
+            # smaller than one transfer's concurrency
+            max_pool_connections=max(
+                self.settings.s3_max_pool_connections, self.settings.s3_max_concurrency
+            ),
+            tcp_keepalive=True,
+            request_checksum_calculation=self.settings.s3_checksum_calculation,
+            response_checksum_validation=self.settings.s3_checksum_calculation,
         )
 
         kwargs: dict[str, Any] = {
@@ -55,7 +112,9 @@ class S3Client:
             kwargs["aws_access_key_id"] = self.settings.aws_access_key_id or "test"
             kwargs["aws_secret_access_key"] = self.settings.aws_secret_access_key or "test"
 
-        return boto3.client(**kwargs)
+        # boto3.client() goes through the shared default session, which is not
+        # thread-safe; a private session per S3Client avoids that
+        return boto3.session.Session().client(**kwargs)
 
     async def upload_document(
         self,
@@ -81,7 +140,7 @@ class S3Client:
         Raises:
             ClientError: If upload fails
         """
-        bucket = bucket or self.settings.s3_bucket_raw_documents
+        bucket = bucket or self._default_bucket
 
         try:
             if isinstance(content, bytes):
@@ -90,13 +149,18 @@ class S3Client:
             extra_args: dict[str, Any] = {"ContentType": content_type}
             if metadata:
                 extra_args["Metadata"] = metadata
+            if self.settings.s3_upload_checksum_algorithm:
+                extra_args["ChecksumAlgorithm"] = self.settings.s3_upload_checksum_algorithm
 
-            self._client.upload_fileobj(
+            await asyncio.to_thread(
+                self._client.upload_fileobj,
                 content,
                 bucket,
                 key,
                 ExtraArgs=extra_args,
+                Config=self._transfer_config,
             )
+            self.invalidate_exists(key, bucket)
 
             s3_uri = f"s3://{bucket}/{key}"
             logger.info(
@@ -134,16 +198,58 @@ class S3Client:
         Raises:
             ClientError: If download fails
         """
-        bucket = bucket or self.settings.s3_bucket_raw_documents
+        bucket = bucket or self._default_bucket
 
         try:
             buffer = BytesIO()
-            self._client.download_fileobj(bucket, key, buffer)
-            buffer.seek(0)
+            await asyncio.to_thread(
+                self._client.download_fileobj,
+                bucket,
+                key,
+                buffer,
+                Config=self._transfer_config,
+            )
 
             logger.info("document_downloaded", bucket=bucket, key=key)
-            return buffer.read()
+            # getvalue() hands over the buffer's bytes without a second copy
+            return buffer.getvalue()
+
+        except ClientError as e:
+            logger.error(
+                "document_download_failed",
+                bucket=bucket,
+                key=key,
+                error=str(e),
+            )
+            raise
+
+    async def stream_document(
+        self,
+        key: str,
+        bucket: str | None = None,
+        chunk_size: int = 1024 * 1024,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream a document from S3 in chunks.
+
+        Only one chunk is held in memory at a time, for consumers that can
+        process content incrementally instead of needing the whole object.
+
+        Args:
+            key: S3 object key
+            bucket: Bucket name (defaults to raw documents bucket)
+            chunk_size: Maximum bytes per yielded chunk
+
+        Yields:
+            Successive chunks of the object body
 
+        Raises:
+            ClientError: If the object cannot be fetched
+        """
+        bucket = bucket or self._default_bucket
+
+        try:
+            response = await asyncio.to_thread(self._client.get_object, Bucket=bucket, Key=key)
         except ClientError as e:
             logger.error(
                 "document_download_failed",
@@ -153,6 +259,17 @@ class S3Client:
             )
             raise
 
+        body = response["Body"]
+        try:
+            chunks = body.iter_chunks(chunk_size=chunk_size)
+            while True:
+                chunk = await asyncio.to_thread(next, chunks, None)
+                if chunk is None:
+                    break
+                yield chunk
+        finally:
+            body.close()
+
     async def get_presigned_url(
         self,
         key: str,
@@ -163,6 +280,11 @@ class S3Client:
         """
         Generate a presigned URL for temporary access to an object.
 
+        URLs are cached and handed out again while at least half their lifetime
+        (and at least s3_presigned_url_min_ttl seconds) remains. Reuse skips the
+        signing work and gives clients a stable URL they can cache; the expiry
+        of a cached URL is never extended.
+
         Args:
             key: S3 object key
             bucket: Bucket name (defaults to raw documents bucket)
@@ -172,14 +294,35 @@ class S3Client:
         Returns:
             Presigned URL
         """
-        bucket = bucket or self.settings.s3_bucket_raw_documents
-
+        bucket = bucket or self._default_bucket
+        expires_in = int(expiration.total_seconds())
+        cache_key = (bucket, key, method, expires_in)
+        min_remaining = max(expires_in / 2, self.settings.s3_presigned_url_min_ttl)
+
+        with self._presigned_urls_lock:
+            cached = self._presigned_urls.get(cache_key)
+            if cached is not None:
+                if cached[1] - time.monotonic() >= min_remaining:
+                    self._presigned_urls.move_to_end(cache_key)
+                    return cached[0]
+                del self._presigned_urls[cache_key]
+
+        # Signing is local CPU work, so this stays on the event loop
+        issued_at = time.monotonic()
         url = self._client.generate_presigned_url(
             method,
             Params={"Bucket": bucket, "Key": key},
-            ExpiresIn=int(expiration.total_seconds()),
+            ExpiresIn=expires_in,
         )
 
+        cache_size = self.settings.s3_presigned_url_cache_size
+        if cache_size and expires_in > min_remaining:
+            with self._presigned_urls_lock:
+                self._presigned_urls[cache_key] = (url, issued_at + expires_in)
+                self._presigned_urls.move_to_end(cache_key)
+                while len(self._presigned_urls) > cache_size:
+                    self._presigned_urls.popitem(last=False)
+
         logger.debug(
             "presigned_url_generated",
             bucket=bucket,
@@ -203,10 +346,11 @@ class S3Client:
         Raises:
             ClientError: If deletion fails
         """
-        bucket = bucket or self.settings.s3_bucket_raw_documents
+        bucket = bucket or self._default_bucket
 
         try:
-            self._client.delete_object(Bucket=bucket, Key=key)
+            await asyncio.to_thread(self._client.delete_object, Bucket=bucket, Key=key)
+            self.invalidate_exists(key, bucket)
             logger.info("document_deleted", bucket=bucket, key=key)
 
         except ClientError as e:
@@ -226,6 +370,11 @@ class S3Client:
         """
         Check if a document exists in S3.
 
+        Results are cached (s3_exists_cache_ttl for hits, the shorter
+        s3_exists_cache_negative_ttl for misses) so repeated checks of the same
+        key skip the HEAD request. Uploads and deletes through this client
+        invalidate the entry; see invalidate_exists for other writers.
+
         Args:
             key: S3 object key
             bucket: Bucket name (defaults to raw documents bucket)
@@ -233,13 +382,140 @@ class S3Client:
         Returns:
             True if document exists, False otherwise
         """
-        bucket = bucket or self.settings.s3_bucket_raw_documents
+        bucket = bucket or self._default_bucket
+        cached = self._cached_exists(bucket, key)
+        if cached is not None:
+            return cached
+
+        exists = await asyncio.to_thread(self._object_exists, bucket, key)
+        self._cache_exists(bucket, key, exists)
+        return exists
+
+    async def documents_exist(
+        self,
+        keys: list[str],
+        bucket: str | None = None,
+    ) -> dict[str, bool]:
+        """
+        Check whether many documents exist in S3.
 
+        Cached results (see document_exists) are used where available. When
+        the remaining keys share a prefix that holds few enough objects, a
+        single paginated listing answers them all; otherwise HEAD requests are
+        issued concurrently (bounded by s3_max_concurrency).
+
+        Args:
+            keys: S3 object keys to check
+            bucket: Bucket name (defaults to raw documents bucket)
+
+        Returns:
+            Mapping of each key to whether it exists
+        """
+        bucket = bucket or self._default_bucket
+        results: dict[str, bool] = {}
+        unchecked: list[str] = []
+        for key in dict.fromkeys(keys):
+            cached = self._cached_exists(bucket, key)
+            if cached is None:
+                unchecked.append(key)
+            else:
+                results[key] = cached
+
+        if unchecked:
+            checked = await self._check_exists(unchecked, bucket)
+            for key, exists in checked.items():
+                self._cache_exists(bucket, key, exists)
+            results.update(checked)
+        return results
+
+    async def _check_exists(self, unique_keys: list[str], bucket: str) -> dict[str, bool]:
+        """Check distinct keys against S3 by listing or concurrent HEADs."""
+        if len(unique_keys) == 1:
+            return {
+                unique_keys[0]: await asyncio.to_thread(self._object_exists, bucket, unique_keys[0])
+            }
+
+        concurrency = self.settings.s3_max_concurrency
+
+        # Only list while it costs no more round-trips than the HEAD fan-out
+        prefix = os.path.commonprefix(unique_keys)
+        if prefix:
+            head_waves = -(-len(unique_keys) // concurrency)
+            max_listed = min(_EXISTS_LIST_LIMIT, _LIST_PAGE_SIZE * head_waves)
+            listed: set[str] = set()
+            async with aclosing(
+                self.list_documents(prefix=prefix, bucket=bucket, page_size=_LIST_PAGE_SIZE)
+            ) as objects:
+                async for obj in objects:
+                    listed.add(obj["key"])
+                    if len(listed) > max_listed:
+                        break
+                else:
+                    return {key: key in listed for key in unique_keys}
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def check(key: str) -> bool:
+            async with semaphore:
+                return await asyncio.to_thread(self._object_exists, bucket, key)
+
+        results = await asyncio.gather(*(check(key) for key in unique_keys))
+        return dict(zip(unique_keys, results, strict=True))
+
+    def _cached_exists(self, bucket: str, key: str) -> bool | None:
+        """Return an unexpired cached existence result, or None."""
+        cache_key = (bucket, key)
+        with self._exists_cache_lock:
+            cached = self._exists_cache.get(cache_key)
+            if cached is None:
+                return None
+            if cached[1] <= time.monotonic():
+                del self._exists_cache[cache_key]
+                return None
+            self._exists_cache.move_to_end(cache_key)
+            return cached[0]
+
+    def _cache_exists(self, bucket: str, key: str, exists: bool) -> None:
+        """Remember an existence result with the TTL for hits or misses."""
+        cache_size = self.settings.s3_exists_cache_size
+        ttl = (
+            self.settings.s3_exists_cache_ttl
+            if exists
+            else self.settings.s3_exists_cache_negative_ttl
+        )
+        if not cache_size or not ttl:
+            return
+
+        cache_key = (bucket, key)
+        with self._exists_cache_lock:
+            self._exists_cache[cache_key] = (exists, time.monotonic() + ttl)
+            self._exists_cache.move_to_end(cache_key)
+            while len(self._exists_cache) > cache_size:
+                self._exists_cache.popitem(last=False)
+
+    def invalidate_exists(self, key: str, bucket: str | None = None) -> None:
+        """
+        Drop the cached existence result for a key.
+
+        upload_document and delete_document call this themselves; call it
+        after changing an object through any other client.
+
+        Args:
+            key: S3 object key
+            bucket: Bucket name (defaults to raw documents bucket)
+        """
+        with self._exists_cache_lock:
+            self._exists_cache.pop((bucket or self._default_bucket, key), None)
+
+    def _object_exists(self, bucket: str, key: str) -> bool:
+        """HEAD an object, mapping a 404 to False (blocking)."""
         try:
             self._client.head_object(Bucket=bucket, Key=key)
             return True
         except ClientError as e:
-            if e.response["Error"]["Code"] == "404":
+            # HEAD responses have no body, so match on the HTTP status rather
+            # than an error code string (which varies across S3-compatible stores)
+            if e.response.get("ResponseMetadata", {}).get("HTTPStatusCode") == 404:
                 return False
             raise
 
@@ -247,55 +523,94 @@ class S3Client:
         self,
         prefix: str = "",
         bucket: str | None = None,
-        max_keys: int = 1000,
-    ) -> list[dict[str, Any]]:
+        page_size: int = _LIST_PAGE_SIZE,
+    ) -> AsyncGenerator[dict[str, Any], None]:
         """
-        List documents in S3 with optional prefix filter.
+        Iterate over documents in S3 with optional prefix filter.
+
+        Follows ListObjectsV2 continuation tokens, fetching one page at a time
+        only as the caller consumes results, so memory stays bounded by the
+        page size and callers can stop early without listing the whole bucket.
 
         Args:
             prefix: Key prefix to filter by
             bucket: Bucket name (defaults to raw documents bucket)
-            max_keys: Maximum number of keys to return
+            page_size: Keys requested per ListObjectsV2 call (max 1000)
 
-        Returns:
-            List of object metadata dictionaries
+        Yields:
+            Object metadata dictionaries
         """
-        bucket = bucket or self.settings.s3_bucket_raw_documents
+        bucket = bucket or self._default_bucket
 
-        try:
-            response = self._client.list_objects_v2(
+        paginator = self._client.get_paginator("list_objects_v2")
+        pages = iter(
+            paginator.paginate(
                 Bucket=bucket,
                 Prefix=prefix,
-                MaxKeys=max_keys,
+                PaginationConfig={"PageSize": page_size},
             )
+        )
 
-            objects = []
-            for obj in response.get("Contents", []):
-                objects.append(
-                    {
-                        "key": obj["Key"],
-                        "size": obj["Size"],
-                        "last_modified": obj["LastModified"],
-                        "etag": obj["ETag"],
-                    }
+        while True:
+            try:
+                page = await asyncio.to_thread(next, pages, None)
+            except ClientError as e:
+                logger.error(
+                    "document_list_failed",
+                    bucket=bucket,
+                    prefix=prefix,
+                    error=str(e),
                 )
+                raise
+            if page is None:
+                return
+
+            for obj in page.get("Contents", []):
+                yield {
+                    "key": obj["Key"],
+                    "size": obj["Size"],
+                    "last_modified": obj["LastModified"],
+                    "etag": obj["ETag"],
+                }
+
+    async def list_documents_batch(
+        self,
+        prefix: str = "",
+        bucket: str | None = None,
+        max_keys: int = 1000,
+    ) -> list[dict[str, Any]]:
+        """
+        List up to max_keys documents in S3 with optional prefix filter.
 
+        Args:
+            prefix: Key prefix to filter by
+            bucket: Bucket name (defaults to raw documents bucket)
+            max_keys: Maximum number of keys to return
+
+        Returns:
+            List of object metadata dictionaries
+        """
+        objects: list[dict[str, Any]] = []
+        if max_keys <= 0:
             return objects
 
-        except ClientError as e:
-            logger.error(
-                "document_list_failed",
-                bucket=bucket,
-                prefix=prefix,
-                error=str(e),
+        async with aclosing(
+            self.list_documents(
+                prefix=prefix, bucket=bucket, page_size=min(max_keys, _LIST_PAGE_SIZE)
             )
-            raise
+        ) as listing:
+            async for obj in listing:
+                objects.append(obj)
+                if len(objects) >= max_keys:
+                    break
+
+        return objects
 
     async def get_object_metadata(
         self,
         key: str,
         bucket: str | None = None,
-    ) -> dict[str, Any]:
+    ) -> S3ObjectMetadata:
         """
         Get metadata for an S3 object.
 
@@ -304,20 +619,20 @@ class S3Client:
             bucket: Bucket name (defaults to raw documents bucket)
 
         Returns:
-            Object metadata dictionary
+            Object metadata
         """
-        bucket = bucket or self.settings.s3_bucket_raw_documents
+        bucket = bucket or self._default_bucket
 
         try:
-            response = self._client.head_object(Bucket=bucket, Key=key)
-
-            return {
-                "content_type": response.get("ContentType"),
-                "content_length": response.get("ContentLength"),
-                "last_modified": response.get("LastModified"),
-                "etag": response.get("ETag"),
-                "metadata": response.get("Metadata", {}),
-            }
+            response = await asyncio.to_thread(self._client.head_object, Bucket=bucket, Key=key)
+
+            return S3ObjectMetadata(
+                response.get("ContentType"),
+                response.get("ContentLength"),
+                response.get("LastModified"),
+                response.get("ETag"),
+                response.get("Metadata", {}),
+            )
 
         except ClientError as e:
             logger.error(
@@ -331,6 +646,7 @@ class S3Client:
 
 # Singleton instance
 _s3_client: S3Client | None = None
+_s3_client_lock = threading.Lock()
 
 
 def get_s3_client(settings: Settings | None = None) -> S3Client:
@@ -338,6 +654,8 @@ def get_s3_client(settings: Settings | None = None) -> S3Client:
     global _s3_client
 
     if _s3_client is None:
-        _s3_client = S3Client(settings)
+        with _s3_client_lock:
+            if _s3_client is None:
+                _s3_client = S3Client(settings)
 
     return _s3_client
@@ -1,16 +1,23 @@
 #!/usr/bin/env python3
 """
 Script to download biomedical engineering research papers from PubMed Central Open Access.
-Uses NCBI E-utilities API via curl to handle SSL certificates properly.
+Uses NCBI E-utilities API over a single pooled HTTP client. Searches are
+fanned out across a small thread pool under NCBI's rate limit, and the full
+text of the candidate papers is fetched in batched efetch requests on the same
+pool, starting while later searches are still running.
 """
 
 import os
-import json
+import threading
 import time
-import subprocess
-import xml.etree.ElementTree as ET
-from datetime import datetime
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from io import BytesIO
+
+import httpx
+import orjson
+from lxml.etree import XMLSyntaxError, iterparse, tostring
 
 # Configuration
 OUTPUT_DIR = "/Users/kevinlee/Desktop/code-stuff/oros/test-data"
@@ -27,33 +34,54 @@ SEARCH_TERMS = [
     "biomedical engineering neural"
 ]
 
-def curl_get(url, timeout=30):
-    """Use curl to make HTTP requests (handles SSL better)."""
-    try:
-        result = subprocess.run(
-            ["curl", "-s", "-L", "--max-time", str(timeout), url],
-            capture_output=True,
-            text=True,
-            timeout=timeout + 10
-        )
-        return result.stdout
-    except Exception as e:
-        print(f"Curl error: {e}")
-        return None
+# NCBI allows 3 requests/second without an API key
+MAX_WORKERS = 3
+REQUESTS_PER_SECOND = 3
+
+# Papers per efetch request, and attempts per batch before its papers are skipped
+FETCH_BATCH_SIZE = 10
+FETCH_ATTEMPTS = 3
+
+
+class RateLimiter:
+    """Spaces requests evenly across threads to stay under a requests/second limit."""
 
-def curl_get_binary(url, timeout=60):
-    """Use curl to get binary content."""
+    def __init__(self, rate):
+        self.interval = 1.0 / rate
+        self.next_slot = time.monotonic()
+        self.lock = threading.Lock()
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            slot = max(self.next_slot, now)
+            self.next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+# One pooled client so every request reuses an open TLS connection
+CLIENT = httpx.Client(
+    follow_redirects=True,
+    limits=httpx.Limits(max_connections=MAX_WORKERS + 1, max_keepalive_connections=MAX_WORKERS + 1),
+)
+RATE_LIMITER = RateLimiter(REQUESTS_PER_SECOND)
+
+def http_request(method, url, timeout=30, binary=False, data=None):
+    """Send a request through the shared client, honoring the NCBI rate limit."""
+    RATE_LIMITER.wait()
     try:
-        result = subprocess.run(
-            ["curl", "-s", "-L", "--max-time", str(timeout), url],
-            capture_output=True,
-            timeout=timeout + 10
-        )
-        return result.stdout
-    except Exception as e:
-        print(f"Curl error: {e}")
+        response = CLIENT.request(method, url, data=data, timeout=timeout)
+        response.raise_for_status()
+        return response.content if binary else response.text
+    except httpx.HTTPError as e:
+        print(f"HTTP error: {e}")
         return None
 
+def http_get(url, timeout=30, binary=False):
+    """GET a URL through the shared client."""
+    return http_request("GET", url, timeout=timeout, binary=binary)
+
 def search_pmc(query, retmax=10):
     """Search PubMed Central for open access articles."""
     params = {
@@ -65,32 +93,49 @@ def search_pmc(query, retmax=10):
     }
     url = f"{BASE_SEARCH_URL}?{urllib.parse.urlencode(params)}"
 
-    response = curl_get(url)
+    response = http_get(url, binary=True)
     if response:
         try:
-            data = json.loads(response)
+            data = orjson.loads(response)
             return data.get("esearchresult", {}).get("idlist", [])
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             print(f"JSON parse error: {e}")
     return []
 
-def fetch_article_metadata(pmcid):
-    """Fetch article metadata from PubMed Central."""
-    params = {
+def fetch_articles_xml(pmcids):
+    """
+    Fetch the full text XML of a batch of articles from PubMed Central in one request.
+
+    The ids are POSTed (which efetch accepts like a GET) so a long id list is
+    not limited by URL length.
+    """
+    data = {
         "db": "pmc",
-        "id": pmcid,
+        "id": ",".join(pmcids),
         "retmode": "xml"
     }
-    url = f"{BASE_FETCH_URL}?{urllib.parse.urlencode(params)}"
-    return curl_get(url, timeout=30)
+    return http_request("POST", BASE_FETCH_URL, timeout=120, binary=True, data=data)
+
+def article_pmc_number(article):
+    """Return the numeric PMC id of an <article> element (without the PMC prefix)."""
+    for article_id in article.findall(".//article-id"):
+        id_type = article_id.get("pub-id-type")
+        if id_type in ("pmcaid", "pmc") and article_id.text:
+            return article_id.text.strip()
+        if id_type == "pmcid" and article_id.text:
+            return article_id.text.strip().removeprefix("PMC")
+    return None
 
-def parse_article_metadata(xml_content):
-    """Parse article metadata from XML."""
+def parse_article_metadata(article):
+    """Parse article metadata from an <article> element."""
     try:
-        root = ET.fromstring(xml_content)
-        article = root.find(".//article")
-        if article is None:
-            return None
+        # Everything below lives in <front>; searching only there keeps the
+        # .// lookups from rescanning the full text and reference list
+        # (the path strings need no precompiling: lxml caches parsed
+        # find()/findall() paths)
+        front = article.find("front")
+        if front is None:
+            front = article
 
         metadata = {
             "pmcid": "",
@@ -103,19 +148,19 @@ def parse_article_metadata(xml_content):
         }
 
         # Get PMCID
-        for article_id in root.findall(".//article-id"):
+        for article_id in front.findall(".//article-id"):
             if article_id.get("pub-id-type") == "pmc":
                 metadata["pmcid"] = f"PMC{article_id.text}"
             elif article_id.get("pub-id-type") == "doi":
                 metadata["doi"] = article_id.text
 
         # Get title
-        title_elem = root.find(".//article-title")
+        title_elem = front.find(".//article-title")
         if title_elem is not None:
             metadata["title"] = "".join(title_elem.itertext()).strip()
 
         # Get authors
-        for contrib in root.findall(".//contrib[@contrib-type='author']"):
+        for contrib in front.findall(".//contrib[@contrib-type='author']"):
             surname = contrib.find(".//surname")
             given_names = contrib.find(".//given-names")
             if surname is not None:
@@ -125,12 +170,16 @@ def parse_article_metadata(xml_content):
                 metadata["authors"].append(name)
 
         # Get journal
-        journal_elem = root.find(".//journal-title")
+        journal_elem = front.find(".//journal-title")
         if journal_elem is not None:
             metadata["journal"] = journal_elem.text or ""
 
         # Get publication date
-        pub_date = root.find(".//pub-date[@pub-type='epub']") or root.find(".//pub-date")
+        # Explicit None check: element truthiness means "has children" and is
+        # deprecated in lxml
+        pub_date = front.find(".//pub-date[@pub-type='epub']")
+        if pub_date is None:
+            pub_date = front.find(".//pub-date")
         if pub_date is not None:
             year = pub_date.find("year")
             month = pub_date.find("month")
@@ -145,33 +194,117 @@ def parse_article_metadata(xml_content):
             metadata["pub_date"] = "-".join(date_parts)
 
         # Get abstract
-        abstract_elem = root.find(".//abstract")
+        abstract_elem = front.find(".//abstract")
         if abstract_elem is not None:
-            metadata["abstract"] = " ".join("".join(p.itertext()).strip() for p in abstract_elem.findall(".//p"))
+            # iter() walks the subtree without the path-matching machinery, and
+            # join() over a list sizes the result in one pass
+            metadata["abstract"] = " ".join(["".join(p.itertext()).strip() for p in abstract_elem.iter("p")])
 
         return metadata
     except Exception as e:
         print(f"Error parsing XML: {e}")
         return None
 
-def download_full_text_xml(pmcid, output_dir):
-    """Download the full text XML from PMC."""
-    params = {
-        "db": "pmc",
-        "id": pmcid.replace("PMC", ""),
-        "retmode": "xml"
-    }
-    url = f"{BASE_FETCH_URL}?{urllib.parse.urlencode(params)}"
-
-    content = curl_get_binary(url, timeout=60)
-    if content:
-        filename = f"{pmcid}.xml"
-        filepath = os.path.join(output_dir, filename)
-        with open(filepath, "wb") as f:
-            f.write(content)
-        return filename
+def fetch_batch_xml(pmcids):
+    """Fetch one efetch batch, retrying a failed request before giving up."""
+    for attempt in range(1, FETCH_ATTEMPTS + 1):
+        content = fetch_articles_xml(pmcids)
+        if content:
+            return content
+        if attempt < FETCH_ATTEMPTS:
+            print(f"  Retrying batch of {len(pmcids)} papers (attempt {attempt + 1}/{FETCH_ATTEMPTS})")
+            time.sleep(attempt)
+    print(f"  Skipping batch of {len(pmcids)} papers after {FETCH_ATTEMPTS} attempts")
     return None
 
+def search_and_fetch(papers_per_topic, candidate_limit):
+    """
+    Run every search and fetch the candidate papers, overlapping the two.
+
+    Search results are consumed in search term order, and each time
+    FETCH_BATCH_SIZE new candidates have accumulated their efetch batch is
+    submitted to the same thread pool, so downloads start while later searches
+    are still running. Batching bounds the cost of a failed or truncated
+    response to the papers in that batch. Each efetch response is both the
+    metadata source and the full text.
+
+    Args:
+        papers_per_topic: Ids requested from each search
+        candidate_limit: Maximum number of papers to fetch
+
+    Returns:
+        Tuple of (unique ids found in search order, candidate ids, articles),
+        where articles maps each candidate to (metadata, xml_content), or to
+        (None, reason) if the article was skipped
+    """
+    # Insertion-ordered de-duplication: candidates follow search term and
+    # relevance order, so reruns pick the same papers (set order varies with
+    # hash randomization)
+    all_pmcids = {}
+    candidates = []
+    pending = []
+    fetches = []
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        search_results = executor.map(
+            lambda term: search_pmc(term, retmax=papers_per_topic), SEARCH_TERMS
+        )
+        for search_term, pmcids in zip(SEARCH_TERMS, search_results, strict=True):
+            print(f"\nSearching for: {search_term}")
+            print(f"  Found {len(pmcids)} papers")
+            new_pmcids = [pmcid for pmcid in dict.fromkeys(pmcids) if pmcid not in all_pmcids]
+            all_pmcids |= dict.fromkeys(new_pmcids)
+
+            selected = new_pmcids[:candidate_limit - len(candidates)]
+            candidates += selected
+            pending += selected
+            while len(pending) >= FETCH_BATCH_SIZE:
+                fetches.append(executor.submit(fetch_batch_xml, pending[:FETCH_BATCH_SIZE]))
+                pending = pending[FETCH_BATCH_SIZE:]
+        if pending:
+            fetches.append(executor.submit(fetch_batch_xml, pending))
+
+        articles = dict.fromkeys(candidates, (None, "could not fetch article"))
+        for fetch in fetches:
+            content = fetch.result()
+            if content:
+                parse_articles(content, articles)
+
+    return all_pmcids, candidates, articles
+
+def parse_articles(content, results):
+    """
+    Parse an efetch response, filling in results for the PMC ids it holds.
+
+    The response is parsed in one streaming pass: each <article> is handled as
+    soon as it is complete and then freed, so only one article is held as a
+    tree at a time.
+    """
+    try:
+        for _, article in iterparse(BytesIO(content), events=("end",)):
+            if article.tag != "article":
+                continue
+
+            pmcid = article_pmc_number(article)
+            if pmcid in results:
+                metadata = parse_article_metadata(article)
+                if not metadata or not metadata.get("title"):
+                    results[pmcid] = (None, "could not parse metadata")
+                else:
+                    xml_content = (
+                        b'<?xml version="1.0" ?><pmc-articleset>'
+                        + tostring(article)
+                        + b"</pmc-articleset>"
+                    )
+                    results[pmcid] = (metadata, xml_content)
+
+            # Free the finished article (lxml also keeps earlier siblings alive)
+            article.clear()
+            while article.getprevious() is not None:
+                del article.getparent()[0]
+    except XMLSyntaxError as e:
+        print(f"Error parsing XML: {e}")
+
 def main():
     print("=" * 60)
     print("PubMed Central Open Access Paper Downloader")
@@ -180,7 +313,6 @@ def main():
     papers_dir = os.path.join(OUTPUT_DIR, "papers")
     os.makedirs(papers_dir, exist_ok=True)
 
-    all_pmcids = set()
     manifest = {
         "download_date": datetime.now().isoformat(),
         "source": "PubMed Central Open Access",
@@ -189,17 +321,11 @@ def main():
 
     # Search for papers on different topics
     papers_per_topic = 7  # ~30-35 papers total across 6 topics
+    target_count = 30
 
-    for search_term in SEARCH_TERMS:
-        print(f"\nSearching for: {search_term}")
-        pmcids = search_pmc(search_term, retmax=papers_per_topic)
-        print(f"  Found {len(pmcids)} papers")
-
-        for pmcid in pmcids:
-            if pmcid not in all_pmcids:
-                all_pmcids.add(pmcid)
-
-        time.sleep(0.4)  # Be nice to the API
+    all_pmcids, candidates, articles = search_and_fetch(
+        papers_per_topic, target_count + 10  # Get a few extra in case of failures
+    )
 
     print(f"\nTotal unique papers found: {len(all_pmcids)}")
     print("\n" + "=" * 60)
@@ -207,30 +333,20 @@ def main():
     print("=" * 60)
 
     downloaded_count = 0
-    target_count = 30
 
-    for pmcid in list(all_pmcids)[:target_count + 10]:  # Get a few extra in case of failures
+    for pmcid in candidates:
         if downloaded_count >= target_count:
             break
 
         print(f"\nProcessing PMC{pmcid}...")
-
-        # Fetch metadata
-        xml_content = fetch_article_metadata(pmcid)
-        if not xml_content:
-            print(f"  Skipping - could not fetch metadata")
+        metadata, result = articles[pmcid]
+        if metadata is None:
+            print(f"  Skipping - {result}")
             continue
 
-        metadata = parse_article_metadata(xml_content)
-        if not metadata or not metadata.get("title"):
-            print(f"  Skipping - could not parse metadata")
-            continue
-
-        # Download full text XML
-        filename = download_full_text_xml(f"PMC{pmcid}", papers_dir)
-        if not filename:
-            print(f"  Skipping - could not download full text")
-            continue
+        filename = f"PMC{pmcid}.xml"
+        with open(os.path.join(papers_dir, filename), "wb") as f:
+            f.write(result)
 
         # Add to manifest
         paper_entry = {
@@ -249,12 +365,10 @@ def main():
         title_display = metadata['title'][:55] if len(metadata['title']) <= 55 else metadata['title'][:55] + "..."
         print(f"  [{downloaded_count}/{target_count}] Downloaded: {title_display}")
 
-        time.sleep(0.35)  # Rate limiting
-
     # Save manifest
     manifest_path = os.path.join(OUTPUT_DIR, "manifest.json")
-    with open(manifest_path, "w", encoding="utf-8") as f:
-        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    with open(manifest_path, "wb") as f:
+        f.write(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
 
     print("\n" + "=" * 60)
     print("DOWNLOAD COMPLETE")
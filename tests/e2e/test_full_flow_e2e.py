@@ -7,6 +7,17 @@ Tests the complete pipeline: Ingest → Process → Search → Chat
 import pytest
 from uuid import UUID
 
+from sqlalchemy import bindparam, update
+
+from services.shared.models import ProcessingJob
+
+# Built once; SQLAlchemy caches its compiled form, and each use only binds values
+_SET_JOB_STATUS = (
+    update(ProcessingJob)
+    .where(ProcessingJob.id == bindparam("job_id"))
+    .values(status=bindparam("new_status"))
+)
+
 
 @pytest.mark.e2e
 class TestFullIngestionToSearchFlowE2E:
@@ -32,7 +43,6 @@ class TestFullIngestionToSearchFlowE2E:
 
         # Step 2: Manually update document to "completed" status
         # (In real scenario, background worker would process it)
-        from sqlalchemy import update
         from services.shared.models import Document, ProcessingStatus
 
         await e2e_db.execute(
@@ -46,7 +56,6 @@ class TestFullIngestionToSearchFlowE2E:
                 has_full_text=True,
             )
         )
-        await e2e_db.commit()
 
         # Step 3: Add a chunk with searchable content
         from services.shared.models import Chunk
@@ -60,6 +69,7 @@ class TestFullIngestionToSearchFlowE2E:
             token_count=15,
         )
         e2e_db.add(chunk)
+        # One commit for the whole setup, right before the search needs it
         await e2e_db.commit()
 
         # Step 4: Search should now find the document (use keyword search - no embeddings in test)
@@ -91,21 +101,20 @@ class TestFullIngestionToSearchFlowE2E:
             "/ingest",
             json={"s3_key": "documents/status-transition-test.xml"},
         )
-        doc_id = UUID(ingest_response.json()["document_id"])
-        job_id = ingest_response.json()["job_id"]
+        ingest_data = ingest_response.json()
+        doc_id = UUID(ingest_data["document_id"])
+        job_id = ingest_data["job_id"]
 
         # Verify initial status
         status_response = await ingestion_client.get(f"/status/{job_id}")
         assert status_response.json()["status"] == "pending"
 
         # Step 2: Simulate processing start
-        from sqlalchemy import update
-        from services.shared.models import ProcessingJob, ProcessingStatus
+        from services.shared.models import ProcessingStatus
 
         await e2e_db.execute(
-            update(ProcessingJob)
-            .where(ProcessingJob.id == UUID(job_id))
-            .values(status=ProcessingStatus.PROCESSING)
+            _SET_JOB_STATUS,
+            {"job_id": UUID(job_id), "new_status": ProcessingStatus.PROCESSING},
         )
         await e2e_db.commit()
 
@@ -115,9 +124,8 @@ class TestFullIngestionToSearchFlowE2E:
 
         # Step 3: Simulate completion
         await e2e_db.execute(
-            update(ProcessingJob)
-            .where(ProcessingJob.id == UUID(job_id))
-            .values(status=ProcessingStatus.COMPLETED)
+            _SET_JOB_STATUS,
+            {"job_id": UUID(job_id), "new_status": ProcessingStatus.COMPLETED},
         )
         await e2e_db.commit()
 
@@ -131,60 +139,99 @@ class TestMultiDocumentSearchE2E:
     """E2E tests for searching across multiple documents."""
 
     @pytest.mark.asyncio
-    async def test_search_ranks_by_relevance(self, retrieval_client, e2e_db):
+    async def test_search_ranks_by_relevance(
+        self, retrieval_client, e2e_db, bulk_insert_documents, e2e_uuids
+    ):
         """Search should rank results by relevance."""
+        from services.shared.database import bulk_insert_chunks
         from services.shared.models import Document, Chunk, ProcessingStatus
-        from uuid import uuid4
+        from sqlalchemy import insert
 
         # Create two documents with different relevance to "CRISPR"
-        doc1_id = uuid4()
-        doc2_id = uuid4()
-
-        # Doc 1: Highly relevant (mentions CRISPR multiple times)
-        doc1 = Document(
-            id=doc1_id,
-            title="CRISPR-Cas9 Gene Editing Guide",
-            abstract="Comprehensive guide to CRISPR technology",
-            s3_key="docs/crispr-guide.xml",
-            processing_status=ProcessingStatus.COMPLETED,
-            has_abstract=True,
-            has_full_text=True,
-        )
+        doc1_id = next(e2e_uuids)
+        doc2_id = next(e2e_uuids)
 
-        # Doc 2: Less relevant (mentions CRISPR once)
-        doc2 = Document(
-            id=doc2_id,
-            title="General Biotechnology Methods",
-            abstract="Various biotech methods including some gene editing",
-            s3_key="docs/biotech-methods.xml",
-            processing_status=ProcessingStatus.COMPLETED,
-            has_abstract=True,
-            has_full_text=True,
+        await e2e_db.execute(
+            insert(Document).values(
+                [
+                    # Doc 1: Highly relevant (mentions CRISPR multiple times)
+                    {
+                        "id": doc1_id,
+                        "title": "CRISPR-Cas9 Gene Editing Guide",
+                        "abstract": "Comprehensive guide to CRISPR technology",
+                        "s3_key": "docs/crispr-guide.xml",
+                        "processing_status": ProcessingStatus.COMPLETED,
+                        "has_abstract": True,
+                        "has_full_text": True,
+                    },
+                    # Doc 2: Less relevant (mentions CRISPR once)
+                    {
+                        "id": doc2_id,
+                        "title": "General Biotechnology Methods",
+                        "abstract": "Various biotech methods including some gene editing",
+                        "s3_key": "docs/biotech-methods.xml",
+                        "processing_status": ProcessingStatus.COMPLETED,
+                        "has_abstract": True,
+                        "has_full_text": True,
+                    },
+                ]
+            )
         )
 
-        e2e_db.add(doc1)
-        e2e_db.add(doc2)
-        await e2e_db.flush()
-
         # Add chunks
-        chunk1 = Chunk(
-            document_id=doc1_id,
-            content="CRISPR-Cas9 is a powerful CRISPR gene editing tool. CRISPR allows precise DNA modifications.",
-            section_title="Introduction",
-            chunk_index=0,
-            token_count=15,
+        await e2e_db.execute(
+            insert(Chunk).values(
+                [
+                    {
+                        "id": next(e2e_uuids),
+                        "document_id": doc1_id,
+                        "content": "CRISPR-Cas9 is a powerful CRISPR gene editing tool. CRISPR allows precise DNA modifications.",
+                        "section_title": "Introduction",
+                        "chunk_index": 0,
+                        "token_count": 15,
+                    },
+                    {
+                        "id": next(e2e_uuids),
+                        "document_id": doc2_id,
+                        "content": "Various methods exist for gene editing including traditional approaches and CRISPR.",
+                        "section_title": "Methods",
+                        "chunk_index": 0,
+                        "token_count": 12,
+                    },
+                ]
+            )
         )
 
-        chunk2 = Chunk(
-            document_id=doc2_id,
-            content="Various methods exist for gene editing including traditional approaches and CRISPR.",
-            section_title="Methods",
-            chunk_index=0,
-            token_count=12,
+        # Unrelated documents the search has to rank past, loaded with COPY
+        noise_ids = [next(e2e_uuids) for _ in range(50)]
+        await bulk_insert_documents(
+            [
+                {
+                    "id": noise_id,
+                    "title": f"Dietary Patterns Cohort Study {i}",
+                    "abstract": "Observational study of diet and cardiovascular outcomes",
+                    "s3_key": f"docs/noise-{i}.xml",
+                    "processing_status": ProcessingStatus.COMPLETED.value,
+                    "has_abstract": True,
+                    "has_full_text": True,
+                }
+                for i, noise_id in enumerate(noise_ids)
+            ]
+        )
+        await bulk_insert_chunks(
+            e2e_db,
+            [
+                {
+                    "id": next(e2e_uuids),
+                    "document_id": noise_id,
+                    "content": "Dietary patterns were associated with cardiovascular outcomes in this cohort.",
+                    "section_title": "Results",
+                    "chunk_index": 0,
+                    "token_count": 11,
+                }
+                for noise_id in noise_ids
+            ],
         )
-
-        e2e_db.add(chunk1)
-        e2e_db.add(chunk2)
         await e2e_db.commit()
 
         # Search for CRISPR
@@ -200,8 +247,10 @@ class TestMultiDocumentSearchE2E:
         assert response.status_code == 200
         data = response.json()
 
-        # Should find both documents
+        # Should find both documents, and none of the unrelated ones
         assert data["total"] >= 2
+        noise = {str(noise_id) for noise_id in noise_ids}
+        assert not noise & {result["document_id"] for result in data["results"]}
 
         # Results should be ordered by relevance score
         if len(data["results"]) >= 2:
@@ -227,7 +276,6 @@ class TestAPIConsistencyE2E:
         doc_id = ingest_response.json()["document_id"]
 
         # Update to completed status
-        from sqlalchemy import update
         from services.shared.models import Document, ProcessingStatus
 
         await e2e_db.execute(
@@ -255,9 +303,11 @@ class TestAPIConsistencyE2E:
         assert ingestion_health.status_code == 200
         assert retrieval_health.status_code == 200
 
-        assert ingestion_health.json()["status"] == "healthy"
-        assert retrieval_health.json()["status"] == "healthy"
+        ingestion_data = ingestion_health.json()
+        retrieval_data = retrieval_health.json()
+        assert ingestion_data["status"] == "healthy"
+        assert retrieval_data["status"] == "healthy"
 
         # Both should connect to same database
-        assert ingestion_health.json()["database"]["status"] == "healthy"
-        assert retrieval_health.json()["database"]["status"] == "healthy"
+        assert ingestion_data["database"]["status"] == "healthy"
+        assert retrieval_data["database"]["status"] == "healthy"
@@ -46,14 +46,11 @@ class TestIngestionCreateDocumentE2E:
         assert data["status"] in ("queued", "pending")
 
         # Verify document was created in database
-        from sqlalchemy import select
         from services.shared.models import Document
 
-        doc_id = UUID(data["document_id"])
-        result = await e2e_db.execute(
-            select(Document).where(Document.id == doc_id)
-        )
-        document = result.scalar_one_or_none()
+        # Primary key lookup: served from the identity map when the endpoint
+        # already loaded the row into this session
+        document = await e2e_db.get(Document, UUID(data["document_id"]))
 
         assert document is not None
         assert document.s3_key == "documents/e2e-test-doc.xml"
@@ -78,14 +75,11 @@ class TestIngestionCreateDocumentE2E:
         data = response.json()
 
         # Verify document has source_url
-        from sqlalchemy import select
         from services.shared.models import Document
 
-        doc_id = UUID(data["document_id"])
-        result = await e2e_db.execute(
-            select(Document).where(Document.id == doc_id)
-        )
-        document = result.scalar_one_or_none()
+        # Primary key lookup: served from the identity map when the endpoint
+        # already loaded the row into this session
+        document = await e2e_db.get(Document, UUID(data["document_id"]))
 
         assert document is not None
         assert document.source_url == "https://example.com/paper.xml"
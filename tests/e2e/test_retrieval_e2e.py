@@ -73,21 +73,47 @@ class TestSearchE2E:
         assert "score" in result
 
     @pytest.mark.asyncio
-    async def test_search_keyword_type(self, retrieval_client, sample_document, sample_chunks):
-        """Keyword search should use full-text search."""
-        response = await retrieval_client.post(
-            "/search",
-            json={
-                "query": "cardiovascular disease",
-                "search_type": "keyword",
-                "limit": 5,
-            },
-        )
+    async def test_search_keyword_type(
+        self, retrieval_client, e2e_db, sample_document, sample_chunks
+    ):
+        """Keyword search should use full-text search backed by the GIN index."""
+        from sqlalchemy import event
+
+        # Capture the SQL the service sends so its plan can be checked below
+        connection = await e2e_db.connection()
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if "plainto_tsquery" in statement:
+                statements.append((statement, parameters))
+
+        event.listen(connection.sync_connection, "before_cursor_execute", capture)
+        try:
+            response = await retrieval_client.post(
+                "/search",
+                json={
+                    "query": "cardiovascular disease",
+                    "search_type": "keyword",
+                    "limit": 5,
+                },
+            )
+        finally:
+            event.remove(connection.sync_connection, "before_cursor_execute", capture)
 
         assert response.status_code == 200
         data = response.json()
         assert data["query_metadata"]["retrieval_strategy"] == "keyword"
 
+        # The fixture table is too small for the planner to prefer an index on
+        # its own; with seq scans disabled, the keyword predicate must use it
+        assert statements
+        statement, parameters = statements[0]
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        await driver_connection.execute("SET LOCAL enable_seqscan = off")
+        plan = await driver_connection.fetchval(f"EXPLAIN (FORMAT JSON) {statement}", *parameters)
+        assert "idx_chunks_content_tsv" in plan
+
     @pytest.mark.asyncio
     async def test_search_with_date_filter(self, retrieval_client, sample_document, sample_chunks):
         """Search should respect date filters."""
@@ -124,6 +150,42 @@ class TestSearchE2E:
         data = response.json()
         assert len(data["results"]) <= 2
 
+    @pytest.mark.asyncio
+    async def test_search_repeated_request_served_from_cache(
+        self, retrieval_client, e2e_db, sample_document, sample_chunks
+    ):
+        """An identical repeat search should be answered without querying the database."""
+        from sqlalchemy import event
+
+        connection = await e2e_db.connection()
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if "plainto_tsquery" in statement:
+                statements.append(statement)
+
+        request = {
+            "query": "cardiovascular disease",
+            "search_type": "keyword",
+            "limit": 5,
+        }
+        event.listen(connection.sync_connection, "before_cursor_execute", capture)
+        try:
+            response = await retrieval_client.post("/search", json=request)
+            repeat_response = await retrieval_client.post("/search", json=request)
+        finally:
+            event.remove(connection.sync_connection, "before_cursor_execute", capture)
+
+        assert response.status_code == 200
+        assert response.headers["X-Cache"] == "MISS"
+        assert repeat_response.headers["X-Cache"] == "HIT"
+        assert len(statements) == 1
+
+        # Same results, but took_ms is the cached request's own latency
+        data, repeat_data = response.json(), repeat_response.json()
+        assert repeat_data["results"] == data["results"]
+        assert repeat_data["query_metadata"]["took_ms"] < data["query_metadata"]["took_ms"]
+
 
 @pytest.mark.e2e
 class TestDocumentsE2E:
@@ -141,6 +203,30 @@ class TestDocumentsE2E:
         assert data["title"] == sample_document["title"]
         assert data["doi"] == sample_document["doi"]
 
+    @pytest.mark.asyncio
+    async def test_get_document_reflects_status_change(
+        self, retrieval_client, e2e_db, sample_document
+    ):
+        """GET /documents/{id} should not serve a stale processing status."""
+        from sqlalchemy import update
+
+        from services.shared.models import Document, ProcessingStatus
+
+        doc_id = str(sample_document["id"])
+        response = await retrieval_client.get(f"/documents/{doc_id}")
+        assert response.json()["processing_status"] == ProcessingStatus.COMPLETED.value
+
+        await e2e_db.execute(
+            update(Document)
+            .where(Document.id == sample_document["id"])
+            .values(processing_status=ProcessingStatus.FAILED)
+        )
+
+        response = await retrieval_client.get(f"/documents/{doc_id}")
+
+        assert response.status_code == 200
+        assert response.json()["processing_status"] == ProcessingStatus.FAILED.value
+
     @pytest.mark.asyncio
     async def test_get_document_not_found(self, retrieval_client):
         """GET /documents/{id} should return 404 for unknown document."""
@@ -185,6 +271,17 @@ class TestDocumentsE2E:
         assert data["limit"] == 1
         assert data["offset"] == 0
 
+        # A page past the last chunk still reports the document's total
+        response = await retrieval_client.get(
+            f"/documents/{doc_id}/chunks",
+            params={"limit": 1, "offset": len(sample_chunks)},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["chunks"] == []
+        assert data["total"] == len(sample_chunks)
+
 
 @pytest.mark.e2e
 class TestChatE2E: